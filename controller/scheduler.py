@@ -98,20 +98,33 @@ class ScanController:
         self._db.log("info", "Snapshot scan requested", {"mode": config.scan_mode.value})
         self._run_pass(config)
 
+    def is_running(self) -> bool:
+        """Return whether a scanner thread is still alive, including one that is stopping."""
+
+        return self._thread is not None and self._thread.is_alive()
+
     def start(self, config: ScanConfig) -> None:
-        if self._thread and self._thread.is_alive():
+        if self.is_running():
             raise RuntimeError("Scan already running")
         self._config = config
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run_loop, name="arbisport-scanner", daemon=True)
+        # Each run gets its own event so a thread that outlived stop() stays stopped.
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            args=(config, self._stop_event),
+            name="arbisport-scanner",
+            daemon=True,
+        )
         self._thread.start()
         self._db.log("info", "Continuous scanning started", {"mode": config.scan_mode.value})
 
-    def stop(self) -> None:
+    def stop(self, timeout: float = 5.0) -> None:
         self._stop_event.set()
         if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=5)
-        self._thread = None
+            self._thread.join(timeout=timeout)
+        # A pass can outlast the join; keep the handle so start() refuses until it exits.
+        if self._thread is not None and not self._thread.is_alive():
+            self._thread = None
         self._db.log("info", "Scanning stopped")
 
     def reset_runtime_state(self) -> None:
@@ -348,11 +361,9 @@ class ScanController:
             status="no_arbitrage",
         )
 
-    def _run_loop(self) -> None:
-        assert self._config is not None
-        config = self._config
+    def _run_loop(self, config: ScanConfig, stop_event: threading.Event) -> None:
         schedule = config.schedule
-        while not self._stop_event.is_set():
+        while not stop_event.is_set():
             start_time = time.time()
             try:
                 within_burst = self._run_pass(config)
@@ -366,7 +377,7 @@ class ScanController:
                 interval = schedule.interval_seconds
             sleep_for = max(interval - elapsed, 0)
             if sleep_for:
-                self._stop_event.wait(timeout=sleep_for)
+                stop_event.wait(timeout=sleep_for)
 
     def _run_pass(self, config: ScanConfig) -> bool:
         now = _to_utc_naive(datetime.now(timezone.utc))
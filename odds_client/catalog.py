@@ -180,6 +180,8 @@ ALL_SPORTS: List[SportInfo] = [
     SportInfo("tennis_wta_aus_open", "WTA Australian Open", "Tennis"),
 ]
 
+SPORT_INDEX: Dict[str, SportInfo] = {sport.key: sport for sport in ALL_SPORTS}
+
 
 # NOTE: Keep bookmaker entries sorted alphabetically by key.
 ALL_BOOKMAKERS: List[BookmakerInfo] = [
@@ -38,6 +38,10 @@ class OddsApiClient:
         self._api_key = api_key
         self._session = session or requests.Session()
 
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
     def list_sports(
         self,
         regions: Optional[Iterable[str]] = None,
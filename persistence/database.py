@@ -5,12 +5,12 @@ from __future__ import annotations
 import csv
 import json
 import sqlite3
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 
 SCHEMA = """
@@ -71,6 +71,14 @@ CREATE TABLE IF NOT EXISTS opportunity_totals (
     id INTEGER PRIMARY KEY CHECK (id = 1),
     total_tested INTEGER NOT NULL
 );
+
+CREATE TABLE IF NOT EXISTS market_catalog (
+    sport_key TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    markets TEXT NOT NULL,
+    PRIMARY KEY (sport_key, scope)
+);
 """
 
 
@@ -110,11 +118,22 @@ class ScanSummary:
     opportunities_tested: int
 
 
+@dataclass
+class StartupSnapshot:
+    profiles: List[str]
+    logs: List[LogRecord]
+    scan_summary: ScanSummary
+    scan_summary_etag: tuple
+
+
 class Database:
     def __init__(self, path: str | Path = "arbisport.db") -> None:
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         with self._connect() as conn:
+            # WAL lets the UI read while the scanner thread writes; the mode is
+            # stored in the database file, so setting it once is enough.
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(SCHEMA)
             self._ensure_arbitrage_columns(conn)
             self._ensure_opportunity_totals(conn)
@@ -122,6 +141,8 @@ class Database:
     @contextmanager
     def _connect(self) -> Iterator[sqlite3.Connection]:
         conn = sqlite3.connect(self._path)
+        # Under WAL, NORMAL only syncs at checkpoints, which still keeps the database consistent.
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
         finally:
@@ -249,14 +270,36 @@ class Database:
             )
             return int(cur.lastrowid)
 
-    def history(self, limit: int = 100) -> Iterable[ArbitrageRecord]:
+    def history(self, limit: int = 100, since_id: Optional[int] = None) -> List[ArbitrageRecord]:
         with self._connect() as conn:
-            cur = conn.execute(
-                "SELECT id, created_at, event_id, event_name, sport_key, commence_time, market_key, edge, total_stake, payout, stake_plan, details"
-                " FROM arbitrage ORDER BY created_at DESC LIMIT ?",
-                (limit,),
-            )
-            for row in cur.fetchall():
+            return list(self._history_rows(conn, limit, since_id))
+
+    def iter_history(self, limit: int = 100, since_id: Optional[int] = None) -> Iterator[ArbitrageRecord]:
+        """Yield history records straight from the cursor.
+
+        The connection stays open until the iterator is exhausted or closed, so callers
+        that may stop early should wrap it in ``contextlib.closing``.
+        """
+
+        with self._connect() as conn:
+            yield from self._history_rows(conn, limit, since_id)
+
+    def _history_rows(
+        self,
+        conn: sqlite3.Connection,
+        limit: int,
+        since_id: Optional[int],
+    ) -> Iterator[ArbitrageRecord]:
+        query = (
+            "SELECT id, created_at, event_id, event_name, sport_key, commence_time, market_key, edge, total_stake, payout, stake_plan, details"
+            " FROM arbitrage"
+        )
+        params: tuple = (limit,)
+        if since_id is not None:
+            query += " WHERE id > ?"
+            params = (since_id, limit)
+        with closing(conn.execute(query + " ORDER BY created_at DESC LIMIT ?", params)) as cur:
+            for row in cur:
                 record_id = int(row[0])
                 created_at = datetime.fromisoformat(row[1])
                 event_id = row[2]
@@ -294,63 +337,124 @@ class Database:
                     details=json.loads(details_json) if details_json else [],
                 )
 
+    def history_etag(self) -> Optional[int]:
+        """Return the newest arbitrage id so pollers can skip unchanged ``history`` reads."""
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(id) FROM arbitrage").fetchone()
+        return row[0]
+
     def delete_arbitrage(self, record_id: int) -> None:
         with self._connect() as conn:
             conn.execute("DELETE FROM arbitrage WHERE id = ?", (record_id,))
         self.log("info", "Arbitrage record deleted", {"arbitrage_id": record_id})
 
+    def cached_markets(self, sport_key: str, scope: str, max_age: float) -> Optional[List[str]]:
+        """Return the market keys stored for ``sport_key`` within the last ``max_age`` seconds.
+
+        ``scope`` separates catalogues fetched with different API keys.
+        """
+
+        cutoff = (datetime.utcnow() - timedelta(seconds=max_age)).isoformat()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT markets FROM market_catalog WHERE sport_key = ? AND scope = ? AND fetched_at >= ?",
+                (sport_key, scope, cutoff),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store_markets(self, sport_key: str, scope: str, markets: List[str]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "REPLACE INTO market_catalog (sport_key, scope, fetched_at, markets) VALUES (?, ?, ?, ?)",
+                (sport_key, scope, datetime.utcnow().isoformat(), json.dumps(list(markets))),
+            )
+
     def clear_event_cache(self) -> None:
         with self._connect() as conn:
             conn.execute("DELETE FROM quotes")
             conn.execute("DELETE FROM events")
         self.log("info", "Event cache cleared")
 
-    def fetch_logs(self, since_id: Optional[int] = None, limit: int = 200) -> List[LogRecord]:
+    def initial_snapshot(self, log_limit: int = 500) -> StartupSnapshot:
+        """Load everything the main window shows on startup over one connection.
+
+        ``logs`` holds the newest ``log_limit`` rows, the same tail the log view keeps.
+        """
+
+        with self._connect() as conn:
+            # One read transaction keeps the pieces consistent with each other.
+            conn.execute("BEGIN")
+            return StartupSnapshot(
+                profiles=self._list_profiles(conn),
+                logs=self._fetch_logs(conn, since_id=0, limit=log_limit, newest=True),
+                scan_summary=self._scan_summary(conn),
+                scan_summary_etag=self._scan_summary_etag(conn),
+            )
+
+    def fetch_logs(self, since_id: Optional[int] = None, limit: int = 200, newest: bool = False) -> List[LogRecord]:
+        """Return up to ``limit`` logs after ``since_id`` in ascending id order.
+
+        With ``newest`` the last ``limit`` matching rows are returned instead of the first.
+        """
+
+        with self._connect() as conn:
+            return self._fetch_logs(conn, since_id, limit, newest)
+
+    def _fetch_logs(
+        self,
+        conn: sqlite3.Connection,
+        since_id: Optional[int],
+        limit: int,
+        newest: bool = False,
+    ) -> List[LogRecord]:
         query = "SELECT id, created_at, level, message, context FROM logs"
-        params: tuple
+        params: tuple = (limit,)
         if since_id is not None:
-            query += " WHERE id > ? ORDER BY id ASC LIMIT ?"
+            query += " WHERE id > ?"
             params = (since_id, limit)
-        else:
-            query += " ORDER BY id ASC LIMIT ?"
-            params = (limit,)
-
-        with self._connect() as conn:
-            cur = conn.execute(query, params)
-            records: List[LogRecord] = []
-            for log_id, created_at, level, message, context in cur.fetchall():
-                if context:
-                    try:
-                        parsed_context = json.loads(context)
-                    except json.JSONDecodeError:
-                        parsed_context = {"raw": context}
-                else:
-                    parsed_context = None
-                records.append(
-                    LogRecord(
-                        id=int(log_id),
-                        created_at=datetime.fromisoformat(created_at),
-                        level=level,
-                        message=message,
-                        context=parsed_context,
-                    )
+        query += f" ORDER BY id {'DESC' if newest else 'ASC'} LIMIT ?"
+
+        rows = conn.execute(query, params).fetchall()
+        if newest:
+            rows.reverse()
+        records: List[LogRecord] = []
+        for log_id, created_at, level, message, context in rows:
+            if context:
+                try:
+                    parsed_context = json.loads(context)
+                except json.JSONDecodeError:
+                    parsed_context = {"raw": context}
+            else:
+                parsed_context = None
+            records.append(
+                LogRecord(
+                    id=int(log_id),
+                    created_at=datetime.fromisoformat(created_at),
+                    level=level,
+                    message=message,
+                    context=parsed_context,
                 )
-            return records
+            )
+        return records
 
     def scan_summary(self) -> ScanSummary:
         with self._connect() as conn:
-            event_count, last_event = conn.execute(
-                "SELECT COUNT(*), MAX(commence_time) FROM events"
-            ).fetchone()
-            arb_count, last_arb = conn.execute(
-                "SELECT COUNT(*), MAX(created_at) FROM arbitrage"
-            ).fetchone()
-            latest_usage = conn.execute(
-                "SELECT remaining, reset_time FROM api_usage ORDER BY id DESC LIMIT 1"
-            ).fetchone()
-            opportunity_row = conn.execute(
-                "SELECT total_tested FROM opportunity_totals WHERE id = 1"
-            ).fetchone()
+            return self._scan_summary(conn)
+
+    def _scan_summary(self, conn: sqlite3.Connection) -> ScanSummary:
+        event_count, last_event = conn.execute(
+            "SELECT COUNT(*), MAX(commence_time) FROM events"
+        ).fetchone()
+        arb_count, last_arb = conn.execute(
+            "SELECT COUNT(*), MAX(created_at) FROM arbitrage"
+        ).fetchone()
+        latest_usage = conn.execute(
+            "SELECT remaining, reset_time FROM api_usage ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        opportunity_row = conn.execute(
+            "SELECT total_tested FROM opportunity_totals WHERE id = 1"
+        ).fetchone()
 
         last_event_time = datetime.fromisoformat(last_event) if last_event else None
         last_arb_time = datetime.fromisoformat(last_arb) if last_arb else None
@@ -373,11 +477,32 @@ class Database:
             opportunities_tested=opportunities_tested,
         )
 
+    def scan_summary_etag(self) -> tuple:
+        """Return a cheap token that changes whenever ``scan_summary`` may change.
+
+        Only indexed ``MAX`` lookups are used so pollers can skip the full
+        summary query while nothing new has been recorded.
+        """
+
+        with self._connect() as conn:
+            return self._scan_summary_etag(conn)
+
+    def _scan_summary_etag(self, conn: sqlite3.Connection) -> tuple:
+        row = conn.execute(
+            "SELECT (SELECT MAX(rowid) FROM events), (SELECT MAX(id) FROM arbitrage),"
+            " (SELECT MAX(id) FROM api_usage),"
+            " (SELECT total_tested FROM opportunity_totals WHERE id = 1)"
+        ).fetchone()
+        return tuple(row)
+
     def list_profiles(self) -> List[str]:
         with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT name FROM settings_profiles ORDER BY LOWER(name)"
-            ).fetchall()
+            return self._list_profiles(conn)
+
+    def _list_profiles(self, conn: sqlite3.Connection) -> List[str]:
+        rows = conn.execute(
+            "SELECT name FROM settings_profiles ORDER BY LOWER(name)"
+        ).fetchall()
         return [row[0] for row in rows]
 
     def get_profile(self, name: str) -> Optional[dict]:
@@ -429,40 +554,42 @@ class Database:
 
     def export_history_csv(self, output_path: str | Path) -> Path:
         output = Path(output_path)
-        rows = list(self.history(limit=1000))
-        with output.open("w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(
-                [
-                    "timestamp",
-                    "event_id",
-                    "event_name",
-                    "sport_key",
-                    "commence_time",
-                    "market",
-                    "edge",
-                    "total_stake",
-                    "payout",
-                    "stake_plan",
-                    "recommendations",
-                ]
-            )
-            for row in rows:
+        # Records are written as the cursor yields them rather than collected first; closing()
+        # releases the connection even if a write fails part-way.
+        with closing(self.iter_history(limit=1000)) as rows:
+            with output.open("w", newline="", encoding="utf-8") as csvfile:
+                writer = csv.writer(csvfile)
                 writer.writerow(
                     [
-                        row.created_at.isoformat(),
-                        row.event_id,
-                        row.event_name,
-                        row.sport_key or "",
-                        row.commence_time.isoformat() if row.commence_time else "",
-                        row.market_key,
-                        f"{row.edge:.4f}",
-                        f"{row.total_stake:.2f}",
-                        f"{row.payout:.2f}",
-                        json.dumps(row.stake_plan),
-                        json.dumps(row.details),
+                        "timestamp",
+                        "event_id",
+                        "event_name",
+                        "sport_key",
+                        "commence_time",
+                        "market",
+                        "edge",
+                        "total_stake",
+                        "payout",
+                        "stake_plan",
+                        "recommendations",
                     ]
                 )
+                for row in rows:
+                    writer.writerow(
+                        [
+                            row.created_at.isoformat(),
+                            row.event_id,
+                            row.event_name,
+                            row.sport_key or "",
+                            row.commence_time.isoformat() if row.commence_time else "",
+                            row.market_key,
+                            f"{row.edge:.4f}",
+                            f"{row.total_stake:.2f}",
+                            f"{row.payout:.2f}",
+                            json.dumps(row.stake_plan),
+                            json.dumps(row.details),
+                        ]
+                    )
         return output
 
 
@@ -1,3 +1,5 @@
+import csv
+import sqlite3
 from decimal import Decimal
 from datetime import datetime, timezone
 
@@ -43,3 +45,124 @@ def test_opportunity_counter(tmp_path):
 
     db.increment_opportunity_tests(-1)
     assert db.total_opportunity_tests() == 3
+
+
+def test_scan_summary_etag_tracks_changes(tmp_path):
+    db = Database(tmp_path / "etag.db")
+    initial = db.scan_summary_etag()
+    assert db.scan_summary_etag() == initial
+
+    db.record_event("evt-1", "basketball_nba", "2025-01-01T00:00:00", {"id": "evt-1"})
+    after_event = db.scan_summary_etag()
+    assert after_event != initial
+
+    db.increment_opportunity_tests(1)
+    assert db.scan_summary_etag() != after_event
+
+    db.clear_event_cache()
+    assert db.scan_summary_etag()[0] is None
+
+
+def test_history_etag_tracks_new_records(tmp_path):
+    db = Database(tmp_path / "history.db")
+    assert db.history_etag() is None
+
+    db.record_arbitrage("evt-1", "A @ B", "basketball_nba", None, "h2h", 0.02, 100, 102, {}, [])
+    first = db.history_etag()
+    assert first == next(iter(db.history(limit=1))).id
+
+    db.record_arbitrage("evt-2", "C @ D", "basketball_nba", None, "h2h", 0.03, 100, 103, {}, [])
+    assert db.history_etag() != first
+    assert [record.event_id for record in db.history(since_id=first)] == ["evt-2"]
+
+
+def test_initial_snapshot_matches_individual_queries(tmp_path):
+    db = Database(tmp_path / "snapshot.db")
+    db.save_profile("Weekend", {"regions": ["us"]})
+    db.record_event("evt-1", "basketball_nba", "2025-01-01T00:00:00", {"id": "evt-1"})
+    db.increment_opportunity_tests(2)
+
+    snapshot = db.initial_snapshot()
+    assert snapshot.profiles == db.list_profiles()
+    newest_logs = db.fetch_logs(since_id=0, limit=500, newest=True)
+    assert [record.id for record in snapshot.logs] == [record.id for record in newest_logs]
+    assert snapshot.scan_summary == db.scan_summary()
+    assert snapshot.scan_summary_etag == db.scan_summary_etag()
+
+
+def test_initial_snapshot_keeps_the_newest_logs(tmp_path):
+    db = Database(tmp_path / "snapshot-logs.db")
+    for index in range(5):
+        db.log("info", f"entry {index}")
+
+    snapshot = db.initial_snapshot(log_limit=2)
+    assert [record.message for record in snapshot.logs] == ["entry 3", "entry 4"]
+
+
+def test_database_uses_wal_journal(tmp_path):
+    path = tmp_path / "wal.db"
+    Database(path)
+
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_market_catalog_cache_is_scoped_and_expires(tmp_path):
+    db = Database(tmp_path / "markets.db")
+    assert db.cached_markets("basketball_nba", "key-a", 3600) is None
+
+    db.store_markets("basketball_nba", "key-a", ["player_points", "alternate_spreads"])
+    assert db.cached_markets("basketball_nba", "key-a", 3600) == ["player_points", "alternate_spreads"]
+    assert db.cached_markets("basketball_nba", "key-b", 3600) is None
+    assert db.cached_markets("basketball_nba", "key-a", -1) is None
+
+
+def test_export_history_csv_streams_all_records(tmp_path):
+    db = Database(tmp_path / "export.db")
+    db.record_event("evt-1", "basketball_nba", "2025-01-01T00:00:00", {"home_team": "A", "away_team": "B"})
+    db.record_arbitrage("evt-1", "", "basketball_nba", None, "h2h", 0.02, 100, 102, {"book": 50.0}, [])
+    db.record_arbitrage("evt-2", "C @ D", "basketball_nba", None, "totals", 0.03, 100, 103, {}, [])
+
+    output = db.export_history_csv(tmp_path / "history.csv")
+    with output.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert sorted(row["event_id"] for row in rows) == ["evt-1", "evt-2"]
+    assert {row["event_id"]: row["market"] for row in rows} == {"evt-1": "h2h", "evt-2": "totals"}
+    assert all(row["event_name"] for row in rows)
+
+
+def test_fetch_logs_newest_returns_tail_in_order(tmp_path):
+    db = Database(tmp_path / "tail.db")
+    ids = [db.log("info", f"line {index}") for index in range(10)]
+
+    tail = db.fetch_logs(since_id=ids[2], limit=3, newest=True)
+    assert [record.message for record in tail] == ["line 7", "line 8", "line 9"]
+    assert [record.message for record in db.fetch_logs(since_id=ids[2], limit=3)] == ["line 3", "line 4", "line 5"]
+
+
+def test_history_is_materialised_and_early_stop_releases_connection(tmp_path, monkeypatch):
+    db = Database(tmp_path / "iter.db")
+    for index in range(3):
+        db.record_arbitrage(f"evt-{index}", "A @ B", "basketball_nba", None, "h2h", 0.02, 100, 102, {}, [])
+
+    closed = []
+
+    class TrackingConnection(sqlite3.Connection):
+        def close(self):
+            closed.append(True)
+            super().close()
+
+    connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect", lambda path: connect(path, factory=TrackingConnection))
+
+    records = db.history(limit=2)
+    assert isinstance(records, list) and len(records) == 2
+    assert closed == [True]
+
+    rows = db.iter_history(limit=3)
+    next(rows)
+    rows.close()
+    assert closed == [True, True]
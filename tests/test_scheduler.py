@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
@@ -210,3 +211,33 @@ def test_run_pass_counts_opportunities(tmp_path, scan_config):
     controller._run_pass(scan_config)
 
     assert db.total_opportunity_tests() >= 1
+
+
+def test_stopped_scan_that_outlives_join_stays_stopped(tmp_path, scan_config):
+    db = Database(tmp_path / "test-stop.db")
+    controller = ScanController(DummyClientEmpty(), db)
+    release = threading.Event()
+    passes = []
+
+    def slow_pass(config):
+        passes.append(config)
+        release.wait()
+        return False
+
+    controller._run_pass = slow_pass
+    controller.start(scan_config)
+    first_thread = controller._thread
+    controller.stop(timeout=0.05)
+
+    assert controller.is_running()
+    with pytest.raises(RuntimeError):
+        controller.start(scan_config)
+
+    release.set()
+    first_thread.join(timeout=2)
+    assert not first_thread.is_alive()
+    assert len(passes) == 1
+
+    controller.start(scan_config)
+    controller.stop()
+    assert not controller.is_running()
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from decimal import Decimal
-from functools import partial
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence
 
 from PySide6.QtCore import (
+    QAbstractTableModel,
     QDateTime,
+    QEvent,
+    QItemSelection,
+    QItemSelectionModel,
+    QModelIndex,
+    QRect,
     QRunnable,
     Qt,
     QThreadPool,
@@ -20,8 +31,11 @@ from PySide6.QtCore import (
     Slot,
     QTimer,
     QObject,
+    QSize,
+    QSortFilterProxyModel,
+    QStringListModel,
 )
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QTextCursor
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -35,17 +49,21 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMainWindow,
     QInputDialog,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
@@ -54,13 +72,19 @@ from normalize.names import NameNormalizer
 from odds_client.catalog import (
     ALL_BOOKMAKERS,
     ALL_SPORTS,
+    BOOKMAKER_INDEX,
+    SPORT_INDEX,
     BookmakerInfo,
     SportInfo,
     filter_bookmakers_by_regions,
 )
 from odds_client.deep_markets import get_deep_markets_for_sport
 from odds_client.client import OddsApiClient
-from persistence.database import ArbitrageRecord, Database, LogRecord
+from persistence.database import ArbitrageRecord, Database, LogRecord, ScanSummary, StartupSnapshot
+
+
+class SnapshotSignals(QObject):
+    finished = Signal()
 
 
 class SnapshotRunnable(QRunnable):
@@ -68,12 +92,16 @@ class SnapshotRunnable(QRunnable):
         super().__init__()
         self._controller = controller
         self._config = config
+        self.signals = SnapshotSignals()
 
     def run(self) -> None:  # pragma: no cover - executed in Qt thread pool
-        self._controller.run_snapshot(self._config)
+        try:
+            self._controller.run_snapshot(self._config)
+        finally:
+            self.signals.finished.emit()
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectionItem:
     key: str
     label: str
@@ -92,9 +120,13 @@ class MultiSelectDialog(QDialog):
         self.setWindowTitle(title)
         self._items = list(items)
         self.selected_keys: List[str] = list(selected)
-        self._build_ui(selected)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._build_ui()
 
-    def _build_ui(self, selected: Sequence[str]) -> None:
+    def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
 
         self.search_edit = QLineEdit()
@@ -103,15 +135,18 @@ class MultiSelectDialog(QDialog):
 
         self.list_widget = QListWidget()
         self.list_widget.setSelectionMode(QListWidget.MultiSelection)
-        selected_set = set(selected)
-        for item in self._items:
-            entry = QListWidgetItem(item.label)
-            entry.setData(Qt.UserRole, item.key)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.addItems([item.label for item in self._items])
+        self._entries = [self.list_widget.item(row) for row in range(self.list_widget.count())]
+        for row, item in enumerate(self._items):
             if item.description:
-                entry.setToolTip(item.description)
-            if item.key in selected_set:
-                entry.setSelected(True)
-            self.list_widget.addItem(entry)
+                self._entries[row].setToolTip(item.description)
+        self.list_widget.setUpdatesEnabled(True)
+        self._keys = [item.key for item in self._items]
+        self._folded_labels = [item.label.casefold() for item in self._items]
+        self._hidden = [False] * len(self._items)
+        self._last_query = ""
         layout.addWidget(self.list_widget)
 
         button_row = QHBoxLayout()
@@ -126,44 +161,120 @@ class MultiSelectDialog(QDialog):
         button_row.addWidget(self.cancel_button)
         layout.addLayout(button_row)
 
-        self.search_edit.textChanged.connect(self._filter_items)
+        self.search_edit.textChanged.connect(self._schedule_filter)
         self.select_all_button.clicked.connect(self._select_all)
         self.clear_button.clicked.connect(self._clear_selection)
         self.ok_button.clicked.connect(self._accept)
         self.cancel_button.clicked.connect(self.reject)
 
+    def _schedule_filter(self, _: str) -> None:
+        # Coalesce bursts of keystrokes into a single filter pass.
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        self._filter_items(self.search_edit.text())
+
     def _filter_items(self, text: str) -> None:
         query = text.casefold()
-        for index in range(self.list_widget.count()):
-            item = self.list_widget.item(index)
-            item.setHidden(bool(query and query not in item.text().casefold()))
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self._set_hidden_rows(query)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+    def _set_hidden_rows(self, query: str) -> None:
+        hidden_rows = self._hidden
+        folded_labels = self._folded_labels
+        narrowing = bool(self._last_query) and query.startswith(self._last_query)
+        self._last_query = query
+        if narrowing:
+            # Extending the query can only hide rows, so skip the ones already hidden.
+            for row, hidden in enumerate(hidden_rows):
+                if not hidden and query not in folded_labels[row]:
+                    hidden_rows[row] = True
+                    self._entries[row].setHidden(True)
+            return
+        for row, folded in enumerate(folded_labels):
+            hidden = bool(query) and query not in folded
+            if hidden_rows[row] != hidden:
+                hidden_rows[row] = hidden
+                self._entries[row].setHidden(hidden)
 
     def _select_all(self) -> None:
-        for index in range(self.list_widget.count()):
-            self.list_widget.item(index).setSelected(True)
+        count = self.list_widget.count()
+        if not count:
+            return
+        model = self.list_widget.model()
+        selection = QItemSelection(model.index(0, 0), model.index(count - 1, 0))
+        self.list_widget.selectionModel().select(selection, QItemSelectionModel.Select)
 
     def _clear_selection(self) -> None:
         self.list_widget.clearSelection()
 
     def _accept(self) -> None:
-        self.selected_keys = [item.data(Qt.UserRole) for item in self.list_widget.selectedItems()]
+        rows = {index.row() for index in self.list_widget.selectionModel().selectedIndexes()}
+        self.selected_keys = [self._keys[row] for row in sorted(rows)]
         self.accept()
 
+
+class CatalogSignals(QObject):
+    finished = Signal(object, object, object, object, object)
+
+
+class CatalogRunnable(QRunnable):
+    def __init__(self, client: OddsApiClient, regions: List[str]) -> None:
+        super().__init__()
+        self._client = client
+        self._regions = regions
+        self.signals = CatalogSignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in background thread
+        # Both catalogue requests are independent, so the round-trips overlap.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sports_future = executor.submit(self._client.list_sports, regions=self._regions, include_all=True)
+            bookmakers_future = executor.submit(self._client.list_bookmakers, regions=self._regions)
+            try:
+                sports_data = sports_future.result().data
+            except Exception as exc:  # pragma: no cover - API failures routed to UI
+                self.signals.finished.emit(self._client, self._regions, None, None, str(exc))
+                return
+            try:
+                bookmakers_data = bookmakers_future.result().data
+            except Exception:
+                bookmakers_data = None
+        self.signals.finished.emit(self._client, self._regions, sports_data, bookmakers_data, None)
+
+
 class SettingsTab(QWidget):
     config_applied = Signal(ScanConfig, OddsApiClient)
     clear_cache_requested = Signal()
     catalog_updated = Signal(object, object)
 
-    def __init__(self, database: Database, parent: Optional[QWidget] = None) -> None:
+    def __init__(
+        self,
+        database: Database,
+        snapshot: Optional[StartupSnapshot] = None,
+        parent: Optional[QWidget] = None,
+    ) -> None:
         super().__init__(parent)
         self._db = database
         self._thread_pool = QThreadPool.globalInstance()
         self._client: Optional[OddsApiClient] = None
-        self._available_sports: List[SportInfo] = list(ALL_SPORTS)
+        self._available_sports: Sequence[SportInfo] = ALL_SPORTS
         self._available_bookmakers: List[BookmakerInfo] = list(ALL_BOOKMAKERS)
         self._selected_sports: List[str] = [sport.key for sport in self._available_sports]
         self._selected_bookmakers: List[str] = [book.key for book in self._available_bookmakers]
         self._per_sport_deep_markets: Dict[str, List[str]] = {}
+        self._deep_market_cache: Dict[str, List[str]] = {}
+        self._catalog_keys: Optional[tuple] = None
+        self._sport_label_map: Dict[str, str] = {}
+        self._sport_title_map: Dict[str, str] = {}
+        self._book_label_map: Dict[str, str] = {}
+        self._sport_items: List[SelectionItem] = []
+        self._bookmaker_items: List[SelectionItem] = []
+        self._summary_texts: Dict[QLabel, str] = {}
+        self._profile_names: List[str] = []
+        self._rebuild_label_maps()
         self._markets = ["h2h", "spreads", "totals"]
         self._regions = ["us", "uk", "eu", "au"]
         self._window_presets = {
@@ -172,6 +283,7 @@ class SettingsTab(QWidget):
             "Next 24 hours": 24,
         }
         self._build_ui()
+        self._reload_profiles(profiles=snapshot.profiles if snapshot else None)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -198,10 +310,11 @@ class SettingsTab(QWidget):
 
         self.region_box = QListWidget()
         self.region_box.setSelectionMode(QListWidget.MultiSelection)
-        for region in self._regions:
-            item = QListWidgetItem(region)
-            item.setSelected(region == "us")
-            self.region_box.addItem(item)
+        self.region_box.addItems(self._regions)
+        self._region_items: List[QListWidgetItem] = [self.region_box.item(row) for row in range(self.region_box.count())]
+        self._region_items[self._regions.index("us")].setSelected(True)
+        self._selected_regions: List[str] = self._selected_items(self.region_box, self._regions)
+        self.region_box.itemSelectionChanged.connect(self._on_regions_changed)
         form_layout.addRow("Regions", self.region_box)
 
         sports_row = QHBoxLayout()
@@ -228,10 +341,11 @@ class SettingsTab(QWidget):
 
         self.markets_box = QListWidget()
         self.markets_box.setSelectionMode(QListWidget.MultiSelection)
-        for market in self._markets:
-            item = QListWidgetItem(market)
-            item.setSelected(True)
-            self.markets_box.addItem(item)
+        self.markets_box.addItems(self._markets)
+        self._market_items: List[QListWidgetItem] = [self.markets_box.item(row) for row in range(self.markets_box.count())]
+        self._market_items[self._markets.index("h2h")].setSelected(True)
+        self._selected_markets: List[str] = self._selected_items(self.markets_box, self._markets)
+        self.markets_box.itemSelectionChanged.connect(self._on_markets_changed)
         form_layout.addRow("Markets", self.markets_box)
 
         deep_market_row = QHBoxLayout()
@@ -254,8 +368,9 @@ class SettingsTab(QWidget):
         self.window_preset_combo.addItems(["Custom range", *self._window_presets.keys()])
         form_layout.addRow("Time preset", self.window_preset_combo)
 
-        self.window_start = QDateTimeEdit(QDateTime.currentDateTime())
-        self.window_end = QDateTimeEdit(QDateTime.currentDateTime().addDays(1))
+        now = QDateTime.currentDateTime()
+        self.window_start = QDateTimeEdit(now)
+        self.window_end = QDateTimeEdit(now.addDays(1))
         self.window_start.setCalendarPopup(True)
         self.window_end.setCalendarPopup(True)
         form_layout.addRow("Window start", self.window_start)
@@ -339,7 +454,6 @@ class SettingsTab(QWidget):
         self._refresh_sport_summary()
         self._refresh_bookmaker_summary()
         self._refresh_deep_market_summary()
-        self._reload_profiles()
 
     def _on_clear_cache(self) -> None:
         reply = QMessageBox.question(
@@ -350,25 +464,48 @@ class SettingsTab(QWidget):
         if reply == QMessageBox.Yes:
             self.clear_cache_requested.emit()
 
-    def _selected_items(self, widget: QListWidget) -> List[str]:
-        selections: List[str] = []
-        for item in widget.selectedItems():
-            key = item.data(Qt.UserRole)
-            selections.append(key if key else item.text())
-        return selections
+    @staticmethod
+    def _selected_items(widget: QListWidget, keys: Sequence[str]) -> List[str]:
+        rows = {index.row() for index in widget.selectionModel().selectedIndexes()}
+        return [keys[row] for row in sorted(rows)]
 
-    def _refresh_sport_summary(self) -> None:
-        label_map = {sport.key: f"{sport.title} ({sport.group})" for sport in self._available_sports}
-        summary = self._format_selection_summary(self._selected_sports, label_map, len(self._available_sports))
-        self.sports_summary.setText(summary)
+    def _on_regions_changed(self) -> None:
+        self._selected_regions = self._selected_items(self.region_box, self._regions)
 
-    def _refresh_bookmaker_summary(self) -> None:
-        label_map = {
+    def _on_markets_changed(self) -> None:
+        self._selected_markets = self._selected_items(self.markets_box, self._markets)
+
+    def _rebuild_label_maps(self) -> None:
+        self._sport_label_map = {sport.key: f"{sport.title} ({sport.group})" for sport in self._available_sports}
+        self._sport_title_map = {sport.key: sport.title for sport in self._available_sports}
+        self._book_label_map = {
             book.key: f"{book.title} [{'/'.join(book.regions)}]"
             for book in self._available_bookmakers
         }
-        summary = self._format_selection_summary(self._selected_bookmakers, label_map, len(self._available_bookmakers))
-        self.bookmakers_summary.setText(summary)
+        # Browser dialogs list the same catalog until it changes.
+        self._sport_items = [
+            SelectionItem(key=key, label=label, description=key) for key, label in self._sport_label_map.items()
+        ]
+        self._bookmaker_items = [
+            SelectionItem(
+                key=book.key,
+                label=f"{book.title} ({'/'.join(book.regions)})",
+                description=(book.url or book.key),
+            )
+            for book in self._available_bookmakers
+        ]
+
+    def _refresh_sport_summary(self) -> None:
+        summary = self._format_selection_summary(
+            self._selected_sports, self._sport_label_map, len(self._available_sports)
+        )
+        self._set_summary_text(self.sports_summary, summary)
+
+    def _refresh_bookmaker_summary(self) -> None:
+        summary = self._format_selection_summary(
+            self._selected_bookmakers, self._book_label_map, len(self._available_bookmakers)
+        )
+        self._set_summary_text(self.bookmakers_summary, summary)
 
     def _format_selection_summary(
         self,
@@ -376,7 +513,9 @@ class SettingsTab(QWidget):
         label_map: Dict[str, str],
         total_available: int,
     ) -> str:
-        if not selected_keys or set(selected_keys) == set(label_map.keys()):
+        if not selected_keys:
+            return f"All ({total_available})"
+        if len(selected_keys) == len(label_map) and all(key in label_map for key in selected_keys):
             return f"All ({total_available})"
         names = [label_map[key] for key in selected_keys if key in label_map]
         if not names:
@@ -386,35 +525,23 @@ class SettingsTab(QWidget):
         return ", ".join(names)
 
     def _open_sport_browser(self) -> None:
-        items = [
-            SelectionItem(key=sport.key, label=f"{sport.title} ({sport.group})", description=sport.key)
-            for sport in self._available_sports
-        ]
-        dialog = MultiSelectDialog("Select sports", items, self._selected_sports, self)
+        dialog = MultiSelectDialog("Select sports", self._sport_items, self._selected_sports, self)
         if dialog.exec() == QDialog.Accepted:
-            self._selected_sports = dialog.selected_keys or [sport.key for sport in self._available_sports]
+            self._selected_sports = dialog.selected_keys or list(self._sport_label_map)
             self._refresh_sport_summary()
 
     def _open_bookmaker_browser(self) -> None:
-        items = [
-            SelectionItem(
-                key=book.key,
-                label=f"{book.title} ({'/'.join(book.regions)})",
-                description=(book.url or book.key),
-            )
-            for book in self._available_bookmakers
-        ]
-        dialog = MultiSelectDialog("Select bookmakers", items, self._selected_bookmakers, self)
+        dialog = MultiSelectDialog("Select bookmakers", self._bookmaker_items, self._selected_bookmakers, self)
         if dialog.exec() == QDialog.Accepted:
-            self._selected_bookmakers = dialog.selected_keys or [book.key for book in self._available_bookmakers]
+            self._selected_bookmakers = dialog.selected_keys or list(self._book_label_map)
             self._refresh_bookmaker_summary()
 
     def _refresh_deep_market_summary(self) -> None:
         if not self._per_sport_deep_markets:
-            self.deep_market_summary.setText("Applies to all selected sports")
+            self._set_summary_text(self.deep_market_summary, "Applies to all selected sports")
             return
         parts: List[str] = []
-        title_map = {sport.key: sport.title for sport in self._available_sports}
+        title_map = self._sport_title_map
         for sport_key, markets in sorted(self._per_sport_deep_markets.items()):
             if not markets:
                 continue
@@ -423,7 +550,13 @@ class SettingsTab(QWidget):
             if len(preview) > 4:
                 display += f" … (+{len(preview) - 4})"
             parts.append(f"{title_map.get(sport_key, sport_key)}: {display}")
-        self.deep_market_summary.setText("; ".join(parts) if parts else "Applies to all selected sports")
+        self._set_summary_text(self.deep_market_summary, "; ".join(parts) if parts else "Applies to all selected sports")
+
+    def _set_summary_text(self, label: QLabel, text: str) -> None:
+        if self._summary_texts.get(label) == text:
+            return
+        self._summary_texts[label] = text
+        label.setText(text)
 
     def _clear_deep_market_overrides(self) -> None:
         if not self._per_sport_deep_markets:
@@ -444,18 +577,32 @@ class SettingsTab(QWidget):
         if not api_key:
             QMessageBox.warning(self, "Missing key", "Please enter an API key first.")
             return
-        regions = self._selected_items(self.region_box)
+        regions = list(self._selected_regions)
+        self.test_button.setEnabled(False)
+        runnable = CatalogRunnable(self._client_for(api_key), regions)
+        runnable.signals.finished.connect(self._on_catalog_loaded)
+        self._thread_pool.start(runnable)
+
+    def _on_catalog_loaded(
+        self,
+        client: OddsApiClient,
+        regions: List[str],
+        sports_data: object,
+        bookmakers_data: object,
+        error: Optional[str],
+    ) -> None:
+        self.test_button.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "API error", f"Failed to validate key: {error}")
+            return
         try:
-            client = OddsApiClient(api_key)
-            response = client.list_sports(regions=regions, include_all=True)
             sports: List[SportInfo] = []
-            known_by_key = {sport.key: sport for sport in ALL_SPORTS}
-            for entry in response.data or []:
+            for entry in sports_data or []:
                 key = entry.get("key") if isinstance(entry, dict) else None
                 if not key:
                     continue
-                if key in known_by_key:
-                    sports.append(known_by_key[key])
+                if key in SPORT_INDEX:
+                    sports.append(SPORT_INDEX[key])
                     continue
                 title = entry.get("title") if isinstance(entry, dict) else None
                 group = entry.get("group") if isinstance(entry, dict) else None
@@ -472,36 +619,34 @@ class SettingsTab(QWidget):
             QMessageBox.critical(self, "API error", f"Failed to validate key: {exc}")
             return
 
-        self._client = client
+        self._adopt_client(client)
         self._available_sports = sports
         available_sport_keys = [sport.key for sport in sports]
-        self._selected_sports = [key for key in self._selected_sports if key in available_sport_keys]
+        available_sport_set = set(available_sport_keys)
+        self._selected_sports = [key for key in self._selected_sports if key in available_sport_set]
         if not self._selected_sports:
-            self._selected_sports = list(available_sport_keys)
+            self._selected_sports = available_sport_keys
         self._per_sport_deep_markets = {
             sport_key: markets
             for sport_key, markets in self._per_sport_deep_markets.items()
-            if sport_key in available_sport_keys
+            if sport_key in available_sport_set
         }
-        self._refresh_sport_summary()
 
         try:
-            bookmaker_response = client.list_bookmakers(regions=regions)
             bookmaker_keys: List[BookmakerInfo] = []
-            known_books = {book.key: book for book in ALL_BOOKMAKERS}
-            for entry in bookmaker_response.data or []:
+            for entry in bookmakers_data or []:
                 if not isinstance(entry, dict):
                     continue
                 key = entry.get("key")
                 if not key:
                     continue
-                if key in known_books:
-                    bookmaker_keys.append(known_books[key])
+                if key in BOOKMAKER_INDEX:
+                    bookmaker_keys.append(BOOKMAKER_INDEX[key])
                     continue
                 title = entry.get("title") or key
                 regions_meta = entry.get("regions")
                 if isinstance(regions_meta, str):
-                    regions_tuple = tuple(part.strip().lower() for part in regions_meta.split(",") if part.strip())
+                    regions_tuple = _parse_regions(regions_meta)
                 elif isinstance(regions_meta, list):
                     regions_tuple = tuple(str(part).lower() for part in regions_meta if str(part))
                 else:
@@ -519,13 +664,19 @@ class SettingsTab(QWidget):
 
         self._available_bookmakers = bookmakers
         available_book_keys = [book.key for book in bookmakers]
-        self._selected_bookmakers = [key for key in self._selected_bookmakers if key in available_book_keys]
+        available_book_set = set(available_book_keys)
+        self._selected_bookmakers = [key for key in self._selected_bookmakers if key in available_book_set]
         if not self._selected_bookmakers:
-            self._selected_bookmakers = list(available_book_keys)
+            self._selected_bookmakers = available_book_keys
+        self._rebuild_label_maps()
+        self._refresh_sport_summary()
         self._refresh_bookmaker_summary()
         self._refresh_deep_market_summary()
 
-        self.catalog_updated.emit(self._available_sports, self._available_bookmakers)
+        catalog_keys = (tuple(sport.key for sport in sports), tuple(book.key for book in bookmakers))
+        if catalog_keys != self._catalog_keys:
+            self._catalog_keys = catalog_keys
+            self.catalog_updated.emit(tuple(self._available_sports), tuple(self._available_bookmakers))
 
         QMessageBox.information(
             self,
@@ -538,18 +689,17 @@ class SettingsTab(QWidget):
         if not api_key:
             QMessageBox.warning(self, "Missing key", "Enter an API key before applying settings.")
             return
-        client = self._client or OddsApiClient(api_key)
+        client = self._client_for(api_key)
+        self._adopt_client(client)
 
         sports = self._selected_sports or [sport.key for sport in self._available_sports]
-        regions = self._selected_items(self.region_box) or ["us"]
+        regions = list(self._selected_regions) or ["us"]
         bookmakers = self._selected_bookmakers or [book.key for book in self._available_bookmakers]
-        markets = self._selected_items(self.markets_box) or ["h2h"]
+        markets = list(self._selected_markets) or ["h2h"]
         deep_markets = [segment.strip() for segment in self.deep_markets_edit.text().split(",") if segment.strip()]
 
-        window_start = self._as_utc_datetime(self.window_start)
-        window_end = self._as_utc_datetime(self.window_end)
-        max_per_book_value = Decimal(str(self.max_per_book_spin.value()))
-        max_per_book = None if self.max_per_book_spin.value() == 0.0 else max_per_book_value
+        window_start, window_end = self._snapshot_window()
+        max_per_book = None if self.max_per_book_spin.value() == 0.0 else self._spin_decimal(self.max_per_book_spin)
 
         config = ScanConfig(
             sports=sports,
@@ -560,9 +710,9 @@ class SettingsTab(QWidget):
             deep_market_map={key: list(values) for key, values in self._per_sport_deep_markets.items()},
             window_start=window_start,
             window_end=window_end,
-            min_edge=Decimal(str(self.edge_spin.value() / 100)),
-            bankroll=Decimal(str(self.bankroll_spin.value())),
-            rounding=Decimal(str(self.rounding_spin.value())),
+            min_edge=self._spin_decimal(self.edge_spin) / 100,
+            bankroll=self._spin_decimal(self.bankroll_spin),
+            rounding=self._spin_decimal(self.rounding_spin),
             min_book_count=self.min_books_spin.value(),
             max_stake_per_book=max_per_book,
             scan_mode=ScanMode(self.scan_mode_combo.currentText()),
@@ -573,28 +723,44 @@ class SettingsTab(QWidget):
             ),
         )
 
-        self._client = client
         self.config_applied.emit(config, client)
 
-    def _as_utc_datetime(self, widget: QDateTimeEdit) -> datetime:
+    def _client_for(self, api_key: str) -> OddsApiClient:
+        # Keeping one client per key reuses its HTTP session and open connections.
+        if self._client is not None and self._client.api_key == api_key:
+            return self._client
+        return OddsApiClient(api_key)
+
+    def _adopt_client(self, client: OddsApiClient) -> None:
+        # Cached market lists came from the previous key, so they go with it.
+        if client is not self._client:
+            self._client = client
+            self._deep_market_cache.clear()
+
+    @staticmethod
+    def _spin_decimal(widget: QDoubleSpinBox) -> Decimal:
+        # Quantize to the displayed precision instead of round-tripping through str().
+        return Decimal(widget.value()).quantize(Decimal(1).scaleb(-widget.decimals()))
+
+    def _snapshot_window(self) -> tuple[datetime, datetime]:
+        return self._as_utc_datetime(self.window_start), self._as_utc_datetime(self.window_end)
+
+    @staticmethod
+    def _as_utc_datetime(widget: QDateTimeEdit) -> datetime:
+        # toUTC() already shifted the value; PySide hands it back naive.
         dt = widget.dateTime().toUTC().toPython()
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
 
     def _collect_profile_payload(self) -> dict:
-        window_start = self._as_utc_datetime(self.window_start)
-        window_end = self._as_utc_datetime(self.window_end)
+        window_start, window_end = self._snapshot_window()
         return {
             "api_key": self.api_key_edit.text(),
-            "regions": self._selected_items(self.region_box) or ["us"],
-            "sports": list(self._selected_sports),
-            "bookmakers": list(self._selected_bookmakers),
-            "markets": self._selected_items(self.markets_box) or ["h2h"],
+            "regions": self._selected_regions or ["us"],
+            "sports": self._selected_sports,
+            "bookmakers": self._selected_bookmakers,
+            "markets": self._selected_markets or ["h2h"],
             "deep_markets": self.deep_markets_edit.text(),
-            "per_sport_deep_markets": {
-                key: list(values) for key, values in self._per_sport_deep_markets.items()
-            },
+            "per_sport_deep_markets": self._per_sport_deep_markets,
             "window_start": window_start.isoformat(),
             "window_end": window_end.isoformat(),
             "window_preset": self.window_preset_combo.currentText(),
@@ -644,14 +810,17 @@ class SettingsTab(QWidget):
         self._db.delete_profile(name)
         self._reload_profiles()
 
-    def _reload_profiles(self, select: Optional[str] = None) -> None:
-        profiles = self._db.list_profiles()
+    def _reload_profiles(self, select: Optional[str] = None, profiles: Optional[List[str]] = None) -> None:
+        if profiles is None:
+            profiles = self._db.list_profiles()
         current = select or self.profile_combo.currentData()
         self.profile_combo.blockSignals(True)
-        self.profile_combo.clear()
-        self.profile_combo.addItem("Select preset…", userData=None)
-        for name in profiles:
-            self.profile_combo.addItem(name, userData=name)
+        if profiles != self._profile_names:
+            self._profile_names = list(profiles)
+            self.profile_combo.clear()
+            self.profile_combo.addItem("Select preset…", userData=None)
+            for name in profiles:
+                self.profile_combo.addItem(name, userData=name)
         if current and current in profiles:
             index = self.profile_combo.findData(current)
             if index >= 0:
@@ -676,12 +845,15 @@ class SettingsTab(QWidget):
             )
             return
 
-        client = self._client or OddsApiClient(api_key)
-        self._client = client
+        client = self._client_for(api_key)
+        self._adopt_client(client)
         dialog = DeepMarketExplorerDialog(
             client,
             self._available_sports,
             existing=self._per_sport_deep_markets,
+            market_cache=self._deep_market_cache,
+            database=self._db,
+            cache_scope=hashlib.sha256(api_key.encode("utf-8")).hexdigest(),
             parent=self,
         )
         if dialog.exec() == QDialog.Accepted:
@@ -694,23 +866,27 @@ class SettingsTab(QWidget):
         api_key = profile.get("api_key", "")
         self.api_key_edit.setText(api_key)
 
-        regions = profile.get("regions") or ["us"]
-        for index in range(self.region_box.count()):
-            item = self.region_box.item(index)
-            item.setSelected(item.text() in regions)
+        regions = {region.casefold() for region in profile.get("regions") or ["us"]}
+        self.region_box.blockSignals(True)
+        for region, item in zip(self._regions, self._region_items):
+            item.setSelected(region.casefold() in regions)
+        self.region_box.blockSignals(False)
+        self._on_regions_changed()
 
         self._set_selected_sports(profile.get("sports") or [])
         self._set_selected_bookmakers(profile.get("bookmakers") or [])
 
         markets = profile.get("markets") or []
-        selected_markets = set(markets) if markets else {item.text() for item in self._iter_items(self.markets_box)}
-        for item in self._iter_items(self.markets_box):
-            item.setSelected(item.text() in selected_markets)
+        selected_markets = {market.casefold() for market in markets}
+        self.markets_box.blockSignals(True)
+        for market, item in zip(self._markets, self._market_items):
+            item.setSelected(not selected_markets or market.casefold() in selected_markets)
+        self.markets_box.blockSignals(False)
+        self._on_markets_changed()
 
         self.deep_markets_edit.setText(profile.get("deep_markets", ""))
-        self._per_sport_deep_markets = {
-            key: list(values) for key, values in (profile.get("per_sport_deep_markets") or {}).items()
-        }
+        # The profile was freshly decoded from the database, so its lists are ours to keep.
+        self._per_sport_deep_markets = dict(profile.get("per_sport_deep_markets") or {})
         self._refresh_deep_market_summary()
 
         start = _parse_iso_datetime(profile.get("window_start"))
@@ -742,7 +918,8 @@ class SettingsTab(QWidget):
         self.burst_window_spin.setValue(int(profile.get("burst_window", self.burst_window_spin.value())))
 
     def _set_selected_sports(self, sports: List[str]) -> None:
-        available = {sport.key for sport in self._available_sports}
+        # The label maps are keyed by the available catalog, in catalog order.
+        available = self._sport_label_map
         filtered = [sport for sport in sports if sport in available]
         if not filtered:
             filtered = list(available)
@@ -750,18 +927,13 @@ class SettingsTab(QWidget):
         self._refresh_sport_summary()
 
     def _set_selected_bookmakers(self, bookmakers: List[str]) -> None:
-        available = {book.key for book in self._available_bookmakers}
+        available = self._book_label_map
         filtered = [book for book in bookmakers if book in available]
         if not filtered:
             filtered = list(available)
         self._selected_bookmakers = filtered
         self._refresh_bookmaker_summary()
 
-    @staticmethod
-    def _iter_items(widget: QListWidget) -> Iterable[QListWidgetItem]:
-        for index in range(widget.count()):
-            yield widget.item(index)
-
     def _on_preset_changed(self, preset: str) -> None:
         if preset == "Custom range":
             self.window_start.setEnabled(True)
@@ -773,12 +945,124 @@ class SettingsTab(QWidget):
             return
 
         now = QDateTime.currentDateTime()
+        end = now.addSecs(hours * 3600)
         self.window_start.setDateTime(now)
-        self.window_end.setDateTime(now.addSecs(hours * 3600))
+        self.window_end.setDateTime(end)
         self.window_start.setEnabled(False)
         self.window_end.setEnabled(False)
 
 
+class ArbitrageActionsDelegate(QStyledItemDelegate):
+    """Paints Rescan/Delete buttons in the actions column and reports clicks on them."""
+
+    rescan_clicked = Signal(object)
+    delete_clicked = Signal(object)
+
+    LABELS = ("Rescan", "Delete")
+
+    def _button_rects(self, option) -> List[QRect]:
+        metrics = option.fontMetrics
+        height = metrics.height() + 10
+        top = option.rect.top() + max(0, (option.rect.height() - height) // 2)
+        left = option.rect.left() + 4
+        rects: List[QRect] = []
+        for label in self.LABELS:
+            width = metrics.horizontalAdvance(label) + 24
+            rects.append(QRect(left, top, width, height))
+            left += width + 4
+        return rects
+
+    def paint(self, painter, option, index: QModelIndex) -> None:  # pragma: no cover - Qt paint hook
+        super().paint(painter, option, index)
+        record = index.data(Qt.UserRole)
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(self.LABELS, self._button_rects(option)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.State_Raised
+            if label != "Rescan" or (record is not None and record.sport_key):
+                button.state |= QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        rects = self._button_rects(option)
+        return QSize(rects[-1].right() - option.rect.left() + 5, rects[0].height() + 4)
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            record = index.data(Qt.UserRole)
+            rescan_rect, delete_rect = self._button_rects(option)
+            position = event.position().toPoint()
+            if rescan_rect.contains(position):
+                if record.sport_key:
+                    self.rescan_clicked.emit(record)
+                return True
+            if delete_rect.contains(position):
+                self.delete_clicked.emit(record)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index: QModelIndex) -> bool:  # pragma: no cover - tooltip hook
+        record = index.data(Qt.UserRole)
+        if record is not None and not record.sport_key and self._button_rects(option)[0].contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "Sport information unavailable for this record.", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+_HISTORY_ROWS = 100
+
+
+class HistorySignals(QObject):
+    finished = Signal(int, object, object, bool)
+
+
+class HistoryRunnable(QRunnable):
+    def __init__(self, database: Database, limit: int, etag: Optional[int] = None, generation: int = 0) -> None:
+        super().__init__()
+        self._db = database
+        self._limit = limit
+        self._etag = etag
+        self._generation = generation
+        self.signals = HistorySignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in background thread
+        incremental = False
+        try:
+            etag = self._db.history_etag()
+            if etag == self._etag:
+                records = None
+            else:
+                # The etag is the newest id already shown, so only later rows are read.
+                incremental = self._etag is not None and etag is not None and etag > self._etag
+                since_id = self._etag if incremental else None
+                records = list(self._db.history(limit=self._limit, since_id=since_id))
+        except Exception:  # pragma: no cover - retried on the next tick
+            etag, records = self._etag, None
+        self.signals.finished.emit(self._generation, etag, records, incremental)
+
+
+class ExportSignals(QObject):
+    finished = Signal(object, object)
+
+
+class ExportRunnable(QRunnable):
+    def __init__(self, database: Database, output_path: Path) -> None:
+        super().__init__()
+        self._db = database
+        self._output_path = output_path
+        self.signals = ExportSignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in background thread
+        try:
+            path = self._db.export_history_csv(self._output_path)
+        except Exception as exc:  # pragma: no cover - export failures routed to UI
+            self.signals.finished.emit(None, str(exc))
+            return
+        self.signals.finished.emit(path, None)
+
+
 class ArbitrageTab(QWidget):
     rescan_requested = Signal(str, str, str)
     delete_requested = Signal(int)
@@ -786,17 +1070,22 @@ class ArbitrageTab(QWidget):
     def __init__(self, database: Database, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._db = database
+        self._row_cache: Dict[int, tuple] = {}
+        self._history_etag: Optional[int] = None
+        self._history_generation = 0
+        self._fetch_inflight = False
         self._build_ui()
+        # Single-shot and re-armed after each refresh so slow queries cannot stack up.
         self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setTimerType(Qt.VeryCoarseTimer)
         self._refresh_timer.setInterval(10_000)
-        self._refresh_timer.timeout.connect(self.refresh)
-        self._refresh_timer.start()
+        self._refresh_timer.timeout.connect(self._on_refresh_timer)
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
-        self.table = QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels(
-            [
+        self.model = RecordTableModel(
+            (
                 "Timestamp",
                 "Event",
                 "Market",
@@ -805,8 +1094,16 @@ class ArbitrageTab(QWidget):
                 "Payout",
                 "Recommendations",
                 "Actions",
-            ]
+            ),
+            tooltip_columns=(1, 6),
+            parent=self,
         )
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self._actions_delegate = ArbitrageActionsDelegate(self.table)
+        self._actions_delegate.rescan_clicked.connect(self._on_rescan_clicked)
+        self._actions_delegate.delete_clicked.connect(self._on_delete_clicked)
+        self.table.setItemDelegateForColumn(7, self._actions_delegate)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
@@ -816,8 +1113,13 @@ class ArbitrageTab(QWidget):
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(6, QHeaderView.Stretch)
         header.setSectionResizeMode(7, QHeaderView.ResizeToContents)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setWordWrap(True)
+        # Event and recommendation cells span up to three lines; anything longer is
+        # elided, with the full text in the tooltip, so rows never need measuring.
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.table.fontMetrics().lineSpacing() * 3 + 8)
+        self.table.setWordWrap(False)
         layout.addWidget(self.table)
 
         self.export_button = QPushButton("Export CSV")
@@ -825,50 +1127,102 @@ class ArbitrageTab(QWidget):
         layout.addWidget(self.export_button, alignment=Qt.AlignRight)
 
     def refresh(self) -> None:
-        records = list(self._db.history(limit=100))
-        self.table.setRowCount(len(records))
-        for row_idx, record in enumerate(records):
-            self.table.setItem(row_idx, 0, QTableWidgetItem(record.created_at.isoformat()))
-            event_parts = [record.event_name]
-            if record.commence_time:
-                event_parts.append(record.commence_time.strftime("%Y-%m-%d %H:%M"))
-            if record.sport_key:
-                event_parts.append(record.sport_key)
-            self.table.setItem(row_idx, 1, QTableWidgetItem("\n".join(event_parts)))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(record.market_key))
-            self.table.setItem(row_idx, 3, QTableWidgetItem(f"{record.edge * 100:.2f}"))
-            self.table.setItem(row_idx, 4, QTableWidgetItem(f"${record.total_stake:.2f}"))
-            self.table.setItem(row_idx, 5, QTableWidgetItem(f"${record.payout:.2f}"))
-            recommendation_text = self._format_recommendations(record.details)
-            rec_item = QTableWidgetItem(recommendation_text)
-            rec_item.setToolTip(recommendation_text)
-            self.table.setItem(row_idx, 6, rec_item)
-            actions_widget = self._make_actions_widget(record)
-            self.table.setCellWidget(row_idx, 7, actions_widget)
-        self.table.resizeRowsToContents()
-
-    def _make_actions_widget(self, record: ArbitrageRecord) -> QWidget:
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        rescan_button = QPushButton("Rescan")
-        if record.sport_key:
-            callback = partial(
-                self.rescan_requested.emit,
-                record.event_id,
-                record.sport_key,
-                record.market_key,
-            )
-            rescan_button.clicked.connect(callback)
+        self._history_generation += 1
+        self._history_etag = self._db.history_etag()
+        self._apply_records(list(self._db.history(limit=_HISTORY_ROWS)))
+
+    def _apply_records(self, records: List[ArbitrageRecord]) -> None:
+        if len(records) == len(self._row_cache) and all(record.id in self._row_cache for record in records):
+            return
+        # Stored arbitrage rows never change, so only newly seen records are formatted.
+        cache: Dict[int, tuple] = {}
+        for record in records:
+            row = self._row_cache.get(record.id)
+            if row is None:
+                row = self._format_row(record)
+            cache[record.id] = row
+        old_ids = list(self._row_cache)
+        new_ids = list(cache)
+        added = next((i for i, record_id in enumerate(new_ids) if record_id in self._row_cache), len(new_ids))
+        self._row_cache = cache
+        # New records usually just push older ones down; insert those rows in place so
+        # the view keeps its selection and scroll position instead of resetting.
+        kept = new_ids[added:]
+        if old_ids and old_ids[: len(kept)] == kept:
+            self.model.prepend_rows([cache[record_id] for record_id in new_ids[:added]], records[:added], len(kept))
         else:
-            rescan_button.setEnabled(False)
-            rescan_button.setToolTip("Sport information unavailable for this record.")
-        delete_button = QPushButton("Delete")
-        delete_button.clicked.connect(partial(self.delete_requested.emit, record.id))
-        layout.addWidget(rescan_button)
-        layout.addWidget(delete_button)
-        layout.addStretch()
-        return container
+            self.model.set_rows([cache[record.id] for record in records], records)
+
+    def _prepend_records(self, records: List[ArbitrageRecord]) -> None:
+        records = [record for record in records if record.id not in self._row_cache]
+        if not records:
+            return
+        cache: Dict[int, tuple] = {record.id: self._format_row(record) for record in records}
+        keep = min(max(_HISTORY_ROWS - len(records), 0), len(self._row_cache))
+        for record_id in list(self._row_cache)[:keep]:
+            cache[record_id] = self._row_cache[record_id]
+        self._row_cache = cache
+        self.model.prepend_rows([cache[record.id] for record in records], records, keep)
+
+    def _format_row(self, record: ArbitrageRecord) -> tuple:
+        event_parts = [record.event_name]
+        if record.commence_time:
+            event_parts.append(_format_minute(record.commence_time))
+        if record.sport_key:
+            event_parts.append(record.sport_key)
+        return (
+            record.created_at.isoformat(),
+            "\n".join(event_parts),
+            record.market_key,
+            f"{record.edge * 100:.2f}",
+            f"${record.total_stake:.2f}",
+            f"${record.payout:.2f}",
+            self._format_recommendations(record.details),
+        )
+
+    def _on_refresh_timer(self) -> None:
+        # Periodic refreshes query the database off the UI thread.
+        if self._fetch_inflight:
+            return
+        self._fetch_inflight = True
+        runnable = HistoryRunnable(self._db, _HISTORY_ROWS, self._history_etag, self._history_generation)
+        runnable.signals.finished.connect(self._on_history_loaded)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_history_loaded(
+        self,
+        generation: int,
+        etag: Optional[int],
+        records: Optional[List[ArbitrageRecord]],
+        incremental: bool,
+    ) -> None:
+        self._fetch_inflight = False
+        try:
+            # A synchronous refresh() since this fetch started supersedes its rows.
+            if records is not None and generation == self._history_generation:
+                self._history_etag = etag
+                if incremental:
+                    self._prepend_records(records)
+                else:
+                    self._apply_records(records)
+        finally:
+            if self.isVisible():
+                self._refresh_timer.start()
+
+    def showEvent(self, event) -> None:  # pragma: no cover - Qt runtime hook
+        super().showEvent(event)
+        if not self._refresh_timer.isActive():
+            self._on_refresh_timer()
+
+    def hideEvent(self, event) -> None:  # pragma: no cover - Qt runtime hook
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+
+    def _on_rescan_clicked(self, record: ArbitrageRecord) -> None:
+        self.rescan_requested.emit(record.event_id, record.sport_key, record.market_key)
+
+    def _on_delete_clicked(self, record: ArbitrageRecord) -> None:
+        self.delete_requested.emit(record.id)
 
     @staticmethod
     def _format_recommendations(details: List[dict]) -> str:
@@ -911,10 +1265,23 @@ class ArbitrageTab(QWidget):
         return "\n".join(parts)
 
     def _export_csv(self) -> None:
-        path = self._db.export_history_csv(Path("arb_history.csv"))
+        self.export_button.setEnabled(False)
+        runnable = ExportRunnable(self._db, Path("arb_history.csv"))
+        runnable.signals.finished.connect(self._on_export_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_export_finished(self, path: Optional[Path], error: Optional[str]) -> None:
+        self.export_button.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Export failed", f"Failed to export history: {error}")
+            return
         QMessageBox.information(self, "Export complete", f"Saved history to {path}")
 
 
+# Event search results change on the order of minutes; repeat searches reuse responses this fresh.
+_ODDS_CACHE_TTL_SECONDS = 60.0
+
+
 class EventSearchSignals(QObject):
     finished = Signal(object, object, object, object)
 
@@ -926,10 +1293,11 @@ class EventSearchRunnable(QRunnable):
         sports: Sequence[str],
         regions: Sequence[str],
         bookmakers: Sequence[str],
-        window_start: datetime,
-        window_end: datetime,
+        window_start: float,
+        window_end: float,
         include_live: bool,
         sport_lookup: Dict[str, str],
+        odds_cache: Optional[Dict[tuple, tuple]] = None,
     ) -> None:
         super().__init__()
         self._client = client
@@ -941,6 +1309,7 @@ class EventSearchRunnable(QRunnable):
         self._include_live = include_live
         self._sport_lookup = dict(sport_lookup)
         self._markets = ["h2h"]
+        self._odds_cache = odds_cache if odds_cache is not None else {}
         self.signals = EventSearchSignals()
 
     def run(self) -> None:  # pragma: no cover - executed in background thread
@@ -948,23 +1317,31 @@ class EventSearchRunnable(QRunnable):
         errors: List[str] = []
         remaining: Optional[int] = None
         reset: Optional[datetime] = None
-        now = datetime.now(timezone.utc)
+        now_ts = time.time()
+        start_ts = self._window_start
+        end_ts = self._window_end
         seen_ids: set[str] = set()
 
-        for sport in self._sports:
-            try:
-                response = self._client.get_odds(
-                    sport_key=sport,
-                    regions=self._regions,
-                    bookmakers=self._bookmakers,
-                    markets=self._markets,
-                )
-            except Exception as exc:  # pragma: no cover - API failures routed to UI
-                errors.append(f"{sport}: {exc}")
+        if not self._sports:
+            self.signals.finished.emit(results, errors, remaining, reset)
+            return
+        # The per-sport requests are independent, so issue them concurrently; map() keeps
+        # the sport order for the dedup below.
+        with ThreadPoolExecutor(max_workers=min(8, len(self._sports))) as executor:
+            fetched = list(executor.map(self._fetch_sport, self._sports))
+
+        for sport, response, error in fetched:
+            if error is not None:
+                errors.append(f"{sport}: {error}")
                 continue
 
             if response.remaining_requests is not None:
-                remaining = response.remaining_requests
+                # Responses can arrive out of order; the lowest count is the most recent.
+                remaining = (
+                    response.remaining_requests
+                    if remaining is None
+                    else min(remaining, response.remaining_requests)
+                )
             if response.reset_time is not None:
                 reset = response.reset_time
 
@@ -974,14 +1351,11 @@ class EventSearchRunnable(QRunnable):
                 event_id = event.get("id")
                 if event_id and event_id in seen_ids:
                     continue
-                commence = _parse_commence_time(event.get("commence_time"))
-                if not commence:
-                    continue
-                commence_utc = _ensure_utc(commence)
-                if commence_utc > self._window_end:
+                commence_ts = _parse_commence_epoch(event.get("commence_time"))
+                if commence_ts is None or commence_ts > end_ts:
                     continue
-                if commence_utc < self._window_start:
-                    if not (self._include_live and commence_utc <= now <= self._window_end):
+                if commence_ts < start_ts:
+                    if not (self._include_live and commence_ts <= now_ts <= end_ts):
                         continue
                 if event_id:
                     seen_ids.add(event_id)
@@ -992,15 +1366,32 @@ class EventSearchRunnable(QRunnable):
                         "sport_title": self._sport_lookup.get(sport, sport),
                         "event_id": event_id or f"{sport}-{len(results)}",
                         "event_name": _format_event_name(event),
-                        "commence": commence_utc,
+                        "commence": datetime.fromtimestamp(commence_ts, timezone.utc),
                         "bookmakers": bookmakers,
-                        "is_live": commence_utc <= now,
+                        "is_live": commence_ts <= now_ts,
                     }
                 )
 
-        results.sort(key=lambda entry: entry["commence"])
+        results.sort(key=itemgetter("commence"))
         self.signals.finished.emit(results, errors, remaining, reset)
 
+    def _fetch_sport(self, sport: str) -> tuple:  # pragma: no cover - executed in background thread
+        key = (sport, tuple(sorted(self._regions)), tuple(sorted(self._bookmakers)), tuple(sorted(self._markets)))
+        cached = self._odds_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _ODDS_CACHE_TTL_SECONDS:
+            return sport, cached[1], None
+        try:
+            response = self._client.get_odds(
+                sport_key=sport,
+                regions=self._regions,
+                bookmakers=self._bookmakers,
+                markets=self._markets,
+            )
+        except Exception as exc:  # pragma: no cover - API failures routed to UI
+            return sport, None, exc
+        self._odds_cache[key] = (time.monotonic(), response)
+        return sport, response, None
+
 
 class EventSearchTab(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -1009,10 +1400,15 @@ class EventSearchTab(QWidget):
         self._client: Optional[OddsApiClient] = None
         self._regions: List[str] = ["us"]
         self._bookmakers: List[str] = []
-        self._available_sports: List[SportInfo] = list(ALL_SPORTS)
-        self._sport_lookup: Dict[str, str] = {sport.key: sport.title for sport in self._available_sports}
-        self._selected_sports: List[str] = [sport.key for sport in self._available_sports]
+        self._available_sports: Sequence[SportInfo] = ALL_SPORTS
+        self._sport_lookup: Dict[str, str] = {}
+        self._sport_label_map: Dict[str, str] = {}
+        self._sport_items: List[SelectionItem] = []
+        self._rebuild_sport_maps()
+        self._selected_sports: List[str] = list(self._sport_lookup)
         self._results: List[dict] = []
+        # Search responses keyed by request, shared with the search runnables.
+        self._odds_cache: Dict[tuple, tuple] = {}
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -1062,17 +1458,25 @@ class EventSearchTab(QWidget):
         button_row.addWidget(self.clear_button)
         layout.addLayout(button_row)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["Sport", "Event", "Start (local)", "Status", "Bookmakers"])
+        self.model = RecordTableModel(("Sport", "Event", "Start (local)", "Status", "Bookmakers"), parent=self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self.model)
+        self._proxy.setFilterRole(RecordTableModel.SEARCH_ROLE)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.table = QTableView()
+        self.table.setModel(self._proxy)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.Stretch)
+        # Event rows are single-line, so size columns from the visible rows and keep row heights fixed.
+        header.setResizeContentsPrecision(0)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         layout.addWidget(self.table)
 
         self.status_label = QLabel("Enter an API key and apply settings to search.")
@@ -1086,15 +1490,24 @@ class EventSearchTab(QWidget):
         self._refresh_sport_summary()
 
     def update_catalog(self, sports: Sequence[SportInfo]) -> None:
-        self._available_sports = list(sports) if sports else list(ALL_SPORTS)
-        self._sport_lookup = {sport.key: sport.title for sport in self._available_sports}
-        available_keys = [sport.key for sport in self._available_sports]
-        self._selected_sports = [key for key in self._selected_sports if key in available_keys]
+        # Catalogs are replaced wholesale, never mutated, so no copy is needed.
+        self._available_sports = sports or ALL_SPORTS
+        self._rebuild_sport_maps()
+        self._selected_sports = [key for key in self._selected_sports if key in self._sport_lookup]
         if not self._selected_sports:
-            self._selected_sports = list(available_keys)
+            self._selected_sports = list(self._sport_lookup)
         self._refresh_sport_summary()
 
+    def _rebuild_sport_maps(self) -> None:
+        self._sport_lookup = {sport.key: sport.title for sport in self._available_sports}
+        self._sport_label_map = {sport.key: f"{sport.title} ({sport.group})" for sport in self._available_sports}
+        self._sport_items = [
+            SelectionItem(key=key, label=label, description=key) for key, label in self._sport_label_map.items()
+        ]
+
     def apply_config(self, config: ScanConfig, client: OddsApiClient) -> None:
+        if client is not self._client:
+            self._odds_cache.clear()
         self._client = client
         self._regions = list(config.regions)
         self._bookmakers = list(config.bookmakers)
@@ -1104,18 +1517,15 @@ class EventSearchTab(QWidget):
         self.status_label.setText("Ready to search.")
 
     def _open_sport_browser(self) -> None:
-        items = [
-            SelectionItem(key=sport.key, label=f"{sport.title} ({sport.group})", description=sport.key)
-            for sport in self._available_sports
-        ]
-        dialog = MultiSelectDialog("Select sports", items, self._selected_sports, self)
+        dialog = MultiSelectDialog("Select sports", self._sport_items, self._selected_sports, self)
         if dialog.exec() == QDialog.Accepted:
-            self._selected_sports = dialog.selected_keys or [sport.key for sport in self._available_sports]
+            self._selected_sports = dialog.selected_keys or list(self._sport_label_map)
             self._refresh_sport_summary()
 
     def _refresh_sport_summary(self) -> None:
-        label_map = {sport.key: f"{sport.title} ({sport.group})" for sport in self._available_sports}
-        summary = self._format_selection_summary(self._selected_sports, label_map, len(self._available_sports))
+        summary = self._format_selection_summary(
+            self._selected_sports, self._sport_label_map, len(self._available_sports)
+        )
         self.sport_summary.setText(summary)
 
     def _run_search(self) -> None:
@@ -1127,19 +1537,25 @@ class EventSearchTab(QWidget):
             QMessageBox.warning(self, "No sports", "Select at least one sport to search.")
             return
 
-        start_dt = self.window_start_edit.dateTime().toUTC().toPyDateTime().replace(tzinfo=timezone.utc)
-        window_end = start_dt + timedelta(hours=self.hours_ahead_spin.value())
+        # The runnable compares POSIX seconds, so the window never leaves Qt as a datetime.
+        window_start = self.window_start_edit.dateTime().toMSecsSinceEpoch() / 1000
+        window_end = window_start + self.hours_ahead_spin.value() * 3600
         include_live = self.include_live_checkbox.isChecked()
 
+        now = time.monotonic()
+        for key in [key for key, (stamp, _) in self._odds_cache.items() if now - stamp >= _ODDS_CACHE_TTL_SECONDS]:
+            del self._odds_cache[key]
+
         runnable = EventSearchRunnable(
             self._client,
             sports,
             self._regions,
             self._bookmakers,
-            start_dt,
+            window_start,
             window_end,
             include_live,
             self._sport_lookup,
+            self._odds_cache,
         )
         runnable.signals.finished.connect(self._on_search_finished)
         self.status_label.setText("Searching…")
@@ -1157,7 +1573,7 @@ class EventSearchTab(QWidget):
         self.search_button.setEnabled(True)
         self._results = results or []
         self.clear_button.setEnabled(bool(self._results))
-        self._apply_filter()
+        self._populate_table(self._results)
 
         parts = [f"Found {len(self._results)} events."]
         if remaining is not None:
@@ -1172,39 +1588,35 @@ class EventSearchTab(QWidget):
         self.status_label.setText(" ".join(parts))
 
     def _apply_filter(self) -> None:
-        query = self.filter_edit.text().strip().casefold()
-        if not query:
-            filtered = list(self._results)
-        else:
-            filtered = []
-            for entry in self._results:
-                haystack = " ".join(
-                    [
-                        entry.get("sport_title", ""),
-                        entry.get("event_name", ""),
-                        " ".join(entry.get("bookmakers", [])),
-                    ]
-                ).casefold()
-                if query in haystack:
-                    filtered.append(entry)
-        self._populate_table(filtered)
+        self._proxy.setFilterFixedString(self.filter_edit.text().strip())
+        if self._proxy.rowCount():
+            self.table.scrollToTop()
 
     def _populate_table(self, entries: Sequence[dict]) -> None:
-        self.table.setRowCount(len(entries))
-        for row, entry in enumerate(entries):
-            self.table.setItem(row, 0, QTableWidgetItem(entry.get("sport_title", entry.get("sport_key", ""))))
-            self.table.setItem(row, 1, QTableWidgetItem(entry.get("event_name", "")))
-            commence: Optional[datetime] = entry.get("commence")
-            self.table.setItem(row, 2, QTableWidgetItem(_format_local_time(commence)))
-            status = "Live" if entry.get("is_live") else "Upcoming"
-            self.table.setItem(row, 3, QTableWidgetItem(status))
-            self.table.setItem(row, 4, QTableWidgetItem(_format_bookmakers(entry.get("bookmakers", []))))
-        if entries:
+        rows: List[tuple] = []
+        search_texts: List[str] = []
+        for entry in entries:
+            sport_title = entry.get("sport_title", "")
+            event_name = entry.get("event_name", "")
+            bookmakers = entry.get("bookmakers", [])
+            rows.append(
+                (
+                    entry.get("sport_title", entry.get("sport_key", "")),
+                    event_name,
+                    _format_local_time(entry.get("commence")),
+                    "Live" if entry.get("is_live") else "Upcoming",
+                    _format_bookmakers(bookmakers),
+                )
+            )
+            search_texts.append(" ".join([sport_title, event_name, " ".join(bookmakers)]))
+        if rows != self.model.rows():
+            self.model.set_rows(rows, entries, search_texts)
+        if self._proxy.rowCount():
             self.table.scrollToTop()
 
     def _clear_results(self) -> None:
         self._results = []
-        self.table.setRowCount(0)
+        self.model.set_rows([])
         self.filter_edit.clear()
         self.clear_button.setEnabled(False)
         self.status_label.setText("Results cleared.")
@@ -1215,7 +1627,9 @@ class EventSearchTab(QWidget):
         label_map: Dict[str, str],
         total_available: int,
     ) -> str:
-        if not selected_keys or set(selected_keys) == set(label_map.keys()):
+        if not selected_keys:
+            return f"All ({total_available})"
+        if len(selected_keys) == len(label_map) and all(key in label_map for key in selected_keys):
             return f"All ({total_available})"
         names = [label_map.get(key, "") for key in selected_keys if label_map.get(key, "")]
         if not names:
@@ -1236,10 +1650,15 @@ def _parse_commence_time(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def _ensure_utc(value: datetime) -> datetime:
-    if value.tzinfo is None:
-        return value.replace(tzinfo=timezone.utc)
-    return value.astimezone(timezone.utc)
+@lru_cache(maxsize=4096)
+def _parse_commence_epoch(value: Optional[str]) -> Optional[float]:
+    # Kick-off strings repeat across events and across repeated searches.
+    commence = _parse_commence_time(value)
+    if commence is None:
+        return None
+    if commence.tzinfo is None:
+        commence = commence.replace(tzinfo=timezone.utc)
+    return commence.timestamp()
 
 
 def _format_event_name(event: dict) -> str:
@@ -1268,11 +1687,21 @@ def _extract_bookmakers(event: dict) -> List[str]:
     return list(dict.fromkeys(bookmakers))
 
 
+@lru_cache(maxsize=512)
 def _format_local_time(value: Optional[datetime]) -> str:
+    # Many events share a kick-off time, so the local-zone conversion is shared too.
     if not value:
         return "—"
-    local = value.astimezone()
-    return local.strftime("%Y-%m-%d %H:%M")
+    return _format_minute(value.astimezone())
+
+
+def _utcnow() -> datetime:
+    # Naive UTC, matching the created_at values stored by the database.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _format_minute(value: datetime) -> str:
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d} {value.hour:02d}:{value.minute:02d}"
 
 
 def _format_bookmakers(bookmakers: Sequence[str]) -> str:
@@ -1284,23 +1713,171 @@ def _format_bookmakers(bookmakers: Sequence[str]) -> str:
     return ", ".join(unique[:3]) + f" … (+{len(unique) - 3})"
 
 
+class RecordTableModel(QAbstractTableModel):
+    """Table model over preformatted rows, replaced wholesale or prepended to on refresh.
+
+    ``Qt.UserRole`` yields the source record of a row and ``SEARCH_ROLE`` its filter text.
+    """
+
+    SEARCH_ROLE = Qt.UserRole + 1
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        tooltip_columns: Sequence[int] = (),
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._tooltip_columns = frozenset(tooltip_columns)
+        self._rows: List[tuple] = []
+        self._records: List[object] = []
+        self._search_texts: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole or (role == Qt.ToolTipRole and column in self._tooltip_columns):
+            values = self._rows[row]
+            return values[column] if column < len(values) else None
+        if role == Qt.UserRole and self._records:
+            return self._records[row]
+        if role == self.SEARCH_ROLE and self._search_texts:
+            return self._search_texts[row]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> object:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def rows(self) -> List[tuple]:
+        return self._rows
+
+    def set_rows(
+        self,
+        rows: Sequence[tuple],
+        records: Optional[Sequence[object]] = None,
+        search_texts: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._records = list(records or ())
+        self._search_texts = list(search_texts or ())
+        self.endResetModel()
+
+    def prepend_rows(
+        self,
+        rows: Sequence[tuple],
+        records: Sequence[object],
+        keep: int,
+        search_texts: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Insert ``rows`` at the top and keep only the first ``keep`` existing rows below them.
+
+        Without ``search_texts`` for the new rows the model drops its search texts
+        rather than let them drift out of line with the rows.
+        """
+
+        if keep < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), keep, len(self._rows) - 1)
+            del self._rows[keep:]
+            del self._records[keep:]
+            del self._search_texts[keep:]
+            self.endRemoveRows()
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+            self._rows[:0] = rows
+            self._records[:0] = records
+            if search_texts and len(self._search_texts) == len(self._rows) - len(rows):
+                self._search_texts[:0] = search_texts
+            else:
+                self._search_texts = []
+            self.endInsertRows()
+
+
+class LogTableModel(QAbstractTableModel):
+    """Table model over preformatted log rows, capped at ``max_rows`` entries."""
+
+    HEADERS = ("Time", "Level", "Message", "Details")
+
+    def __init__(self, max_rows: int = 500, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._max_rows = max_rows
+        self._rows: List[tuple] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole or (role == Qt.ToolTipRole and index.column() == 3):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> object:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def append_rows(self, rows: Sequence[tuple]) -> None:
+        rows = rows[-self._max_rows :]
+        if not rows:
+            return
+        # Trim first so the view never lays out more than max_rows rows.
+        excess = len(self._rows) + len(rows) - self._max_rows
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self._rows[:excess]
+            self.endRemoveRows()
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+
+# Matches the 500 rows kept by the log table and raw feed.
+_LOG_TAIL_ROWS = 500
+
+
 class LogsTab(QWidget):
-    def __init__(self, database: Database, parent: Optional[QWidget] = None) -> None:
+    def __init__(
+        self,
+        database: Database,
+        snapshot: Optional[StartupSnapshot] = None,
+        parent: Optional[QWidget] = None,
+    ) -> None:
         super().__init__(parent)
         self._db = database
-        self._entries: List[LogRecord] = []
+        self._timestamp_cache: Dict[datetime, str] = {}
+        self._raw_buffer: List[str] = []
+        self._table_dirty = False
         self._build_ui()
+        self._raw_flush_timer = QTimer(self)
+        self._raw_flush_timer.setSingleShot(True)
+        self._raw_flush_timer.setInterval(50)
+        self._raw_flush_timer.timeout.connect(self._flush_raw)
         self._last_log_id = 0
         self._timer = QTimer(self)
-        self._timer.setInterval(3000)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.VeryCoarseTimer)
+        self._timer.setInterval(5000)
         self._timer.timeout.connect(self._poll_logs)
-        self._timer.start()
-        self._table_timer = QTimer(self)
-        self._table_timer.setInterval(1000)
-        self._table_timer.timeout.connect(self._render_table_if_needed)
-        self._table_timer.start()
-        self._table_dirty = False
-        self._poll_logs()
+        if snapshot is not None:
+            self._append_records(snapshot.logs)
+        else:
+            self._poll_logs()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -1308,109 +1885,176 @@ class LogsTab(QWidget):
 
         readable = QWidget()
         readable_layout = QVBoxLayout(readable)
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(["Time", "Level", "Message", "Details"])
+        self.model = LogTableModel(max_rows=500, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
+        # Size the ResizeToContents columns from the visible rows only.
+        header.setResizeContentsPrecision(0)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         readable_layout.addWidget(self.table)
         self.tabs.addTab(readable, "Readable")
 
-        self.raw_view = QTextEdit()
+        # Plain text skips rich-text layout; the raw feed is only ever appended to.
+        self.raw_view = QPlainTextEdit()
         self.raw_view.setReadOnly(True)
+        self.raw_view.setUndoRedoEnabled(False)
+        # Keep the raw feed to the same 500 lines as the table; Qt drops the oldest blocks.
+        self.raw_view.setMaximumBlockCount(500)
         self.tabs.addTab(self.raw_view, "Raw feed")
+        self.tabs.currentChanged.connect(self._scroll_table_if_needed)
 
         layout.addWidget(self.tabs)
 
     def append_log(self, level: str, message: str) -> None:
-        timestamp = datetime.utcnow().isoformat()
         record = LogRecord(
             id=self._last_log_id + 1,
-            created_at=datetime.fromisoformat(timestamp),
+            created_at=_utcnow(),
             level=level,
             message=message,
             context=None,
         )
-        self._append_entry(record)
+        self._append_entries([record])
 
     def _poll_logs(self) -> None:
         try:
-            records = self._db.fetch_logs(since_id=self._last_log_id)
-        except Exception as exc:  # pragma: no cover - defensive UI guard
-            timestamp = datetime.utcnow().isoformat()
-            self.raw_view.append(f"[{timestamp}] ERROR: Log fetch failed ({exc})")
-            return
-        for record in records:
-            self._append_entry(record)
-            self._last_log_id = record.id
+            # Polling pauses while the tab is hidden; the views only keep the newest rows,
+            # so a backlog is skipped straight to its tail instead of paged through.
+            try:
+                records = self._db.fetch_logs(since_id=self._last_log_id, limit=_LOG_TAIL_ROWS, newest=True)
+            except Exception as exc:  # pragma: no cover - defensive UI guard
+                self._append_raw(f"[{_utcnow().isoformat()}] ERROR: Log fetch failed ({exc})")
+            else:
+                self._append_records(records)
+        finally:
+            # Re-arm only once this poll is done so a slow fetch delays the next one.
+            if self.isVisible():
+                self._timer.start()
 
-    def _append_entry(self, record: LogRecord) -> None:
-        context_text = self._format_context(record.context)
-        self.raw_view.append(
-            f"[{record.created_at.isoformat()}] {record.level.upper()}: {record.message}{(' ' + context_text) if context_text else ''}"
-        )
-        self._entries.append(record)
-        if len(self._entries) > 500:
-            self._entries = self._entries[-500:]
+    def _append_records(self, records: Sequence[LogRecord]) -> None:
+        if records:
+            self._append_entries(records)
+            self._last_log_id = records[-1].id
+
+    def _append_entries(self, records: Sequence[LogRecord]) -> None:
+        rows: List[tuple] = []
+        for record in records:
+            context_text = self._format_context(record.context)
+            level = sys.intern(record.level.upper())
+            self._append_raw(
+                f"[{record.created_at.isoformat()}] {level}: {record.message}{(' ' + context_text) if context_text else ''}"
+            )
+            rows.append((self._format_timestamp(record.created_at), level, record.message, context_text))
+        self.model.append_rows(rows)
         self._table_dirty = True
-        if self.isVisible():
-            self._render_table_if_needed()
-
-    def _render_table(self) -> None:
-        rows = self._entries[-500:]
-        self.table.setRowCount(len(rows))
-        for row_idx, record in enumerate(rows):
-            self.table.setItem(row_idx, 0, QTableWidgetItem(record.created_at.strftime("%Y-%m-%d %H:%M:%S")))
-            self.table.setItem(row_idx, 1, QTableWidgetItem(record.level.upper()))
-            self.table.setItem(row_idx, 2, QTableWidgetItem(record.message))
-            details = self._format_context(record.context)
-            details_item = QTableWidgetItem(details)
-            details_item.setToolTip(details)
-            self.table.setItem(row_idx, 3, details_item)
-        self.table.scrollToBottom()
-        self._table_dirty = False
+        self._scroll_table_if_needed()
 
-    def _render_table_if_needed(self) -> None:
-        if not self._table_dirty:
-            return
-        if not self.isVisible():
+    def _append_raw(self, line: str) -> None:
+        self._raw_buffer.append(line)
+        if not self._raw_flush_timer.isActive():
+            self._raw_flush_timer.start()
+
+    def _flush_raw(self) -> None:
+        if not self._raw_buffer:
             return
-        if self.tabs.currentWidget() is not self.tabs.widget(0):
+        text = "\n".join(self._raw_buffer)
+        self._raw_buffer.clear()
+        document = self.raw_view.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(f"\n{text}" if not document.isEmpty() else text)
+        scrollbar = self.raw_view.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def _format_timestamp(self, value: datetime) -> str:
+        # Scan bursts log many records within the same second.
+        second = value.replace(microsecond=0)
+        text = self._timestamp_cache.get(second)
+        if text is None:
+            if len(self._timestamp_cache) >= 500:
+                self._timestamp_cache.clear()
+            text = value.strftime("%Y-%m-%d %H:%M:%S")
+            self._timestamp_cache[second] = text
+        return text
+
+    def _scroll_table_if_needed(self) -> None:
+        if not self._table_dirty or not self.table.isVisible():
             return
-        self._render_table()
+        self.table.scrollToBottom()
+        self._table_dirty = False
 
     def showEvent(self, event) -> None:  # pragma: no cover - Qt runtime hook
         super().showEvent(event)
-        self._render_table_if_needed()
+        if not self._timer.isActive():
+            self._poll_logs()
+        self._scroll_table_if_needed()
+
+    def hideEvent(self, event) -> None:  # pragma: no cover - Qt runtime hook
+        super().hideEvent(event)
+        self._timer.stop()
 
     @staticmethod
     def _format_context(context: Optional[dict]) -> str:
-        if not context:
-            return ""
         if isinstance(context, dict):
-            parts = []
-            for key in sorted(context.keys()):
-                value = context[key]
-                parts.append(f"{key}={_stringify(value)}")
-            return ", ".join(parts)
-        return _stringify(context)
+            if len(context) > 1:
+                keys = _sorted_context_keys(tuple(context))
+                return ", ".join([f"{key}={_stringify(context[key])}" for key in keys])
+            for key, value in context.items():
+                return f"{key}={_stringify(value)}"
+            return ""
+        # fetch_logs can decode non-object JSON, so keep the generic fallback.
+        return _stringify(context) if context else ""
+
+
+class ScanSummarySignals(QObject):
+    finished = Signal(object, object)
+
+
+class ScanSummaryRunnable(QRunnable):
+    def __init__(self, database: Database, etag: Optional[tuple]) -> None:
+        super().__init__()
+        self._db = database
+        self._etag = etag
+        self.signals = ScanSummarySignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in background thread
+        try:
+            etag = self._db.scan_summary_etag()
+            summary = self._db.scan_summary() if etag != self._etag else None
+        except Exception:  # pragma: no cover - retried on the next tick
+            etag, summary = self._etag, None
+        self.signals.finished.emit(etag, summary)
 
 
 class DashboardTab(QWidget):
-    def __init__(self, database: Database, parent: Optional[QWidget] = None) -> None:
+    def __init__(
+        self,
+        database: Database,
+        snapshot: Optional[StartupSnapshot] = None,
+        parent: Optional[QWidget] = None,
+    ) -> None:
         super().__init__(parent)
         self._db = database
+        self._summary_etag: Optional[tuple] = None
+        self._fetch_inflight = False
         self._build_ui()
         self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.VeryCoarseTimer)
         self._timer.setInterval(5000)
-        self._timer.timeout.connect(self.refresh)
-        self._timer.start()
-        self.refresh()
+        self._timer.timeout.connect(self._on_timer)
+        if snapshot is not None:
+            self._summary_etag = snapshot.scan_summary_etag
+            self._show_summary(snapshot.scan_summary)
+        else:
+            self.refresh()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -1419,9 +2063,14 @@ class DashboardTab(QWidget):
 
     def update_status(self, message: str) -> None:
         self.status_label.setText(message)
+        # The label is shared with the stats, so let the next poll redraw them.
+        self._summary_etag = None
 
     def refresh(self) -> None:
-        summary = self._db.scan_summary()
+        self._summary_etag = self._db.scan_summary_etag()
+        self._show_summary(self._db.scan_summary())
+
+    def _show_summary(self, summary: ScanSummary) -> None:
         parts = [
             f"Events tracked: {summary.event_count}",
             f"Last event time: {self._format_time(summary.last_event_time)}",
@@ -1433,6 +2082,34 @@ class DashboardTab(QWidget):
         ]
         self.status_label.setText("\n".join(parts))
 
+    def _on_timer(self) -> None:
+        if self._fetch_inflight:
+            return
+        self._fetch_inflight = True
+        runnable = ScanSummaryRunnable(self._db, self._summary_etag)
+        runnable.signals.finished.connect(self._on_summary_loaded)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_summary_loaded(self, etag: Optional[tuple], summary: Optional[ScanSummary]) -> None:
+        self._fetch_inflight = False
+        try:
+            # The runnable only builds a summary when the etag moved.
+            if summary is not None:
+                self._summary_etag = etag
+                self._show_summary(summary)
+        finally:
+            if self.isVisible():
+                self._timer.start()
+
+    def showEvent(self, event) -> None:  # pragma: no cover - Qt runtime hook
+        super().showEvent(event)
+        if not self._timer.isActive():
+            self._on_timer()
+
+    def hideEvent(self, event) -> None:  # pragma: no cover - Qt runtime hook
+        super().hideEvent(event)
+        self._timer.stop()
+
     @staticmethod
     def _format_time(value: Optional[datetime]) -> str:
         if not value:
@@ -1440,6 +2117,9 @@ class DashboardTab(QWidget):
         return value.strftime("%Y-%m-%d %H:%M:%S")
 
 
+_DEC_100 = Decimal(100)
+
+
 class MainWindow(QMainWindow):
     def __init__(self, database: Database, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -1449,28 +2129,33 @@ class MainWindow(QMainWindow):
         self._controller: Optional[ScanController] = None
         self._config: Optional[ScanConfig] = None
         self._client: Optional[OddsApiClient] = None
+        self._snapshot_inflight = False
+        self._snapshot_pending = False
 
         self.tabs = QTabWidget()
-        self.settings_tab = SettingsTab(database)
-        self.dashboard_tab = DashboardTab(database)
-        self.arbitrage_tab = ArbitrageTab(database)
-        self.events_tab = EventSearchTab()
-        self.logs_tab = LogsTab(database)
+        # One connection serves every tab's initial query.
+        snapshot = database.initial_snapshot(log_limit=_LOG_TAIL_ROWS)
+        self.settings_tab = SettingsTab(database, snapshot)
+        self.dashboard_tab = DashboardTab(database, snapshot)
+        self.logs_tab = LogsTab(database, snapshot)
+        # The arbitrage and event search tabs do no work until opened, so they are
+        # only built on first visit; until then the window keeps their inputs.
+        self.arbitrage_tab: Optional[ArbitrageTab] = None
+        self.events_tab: Optional[EventSearchTab] = None
+        self._event_sports: Sequence[SportInfo] = ALL_SPORTS
+        self._tab_factories: Dict[int, Callable[[], QWidget]] = {}
 
         self.tabs.addTab(self.settings_tab, "Settings")
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
-        self.tabs.addTab(self.arbitrage_tab, "Arbitrage")
-        self.tabs.addTab(self.events_tab, "Events")
+        self._add_lazy_tab("Arbitrage", self._build_arbitrage_tab)
+        self._add_lazy_tab("Events", self._build_events_tab)
         self.tabs.addTab(self.logs_tab, "Logs")
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         self.setCentralWidget(self.tabs)
 
         self.settings_tab.config_applied.connect(self._on_config_applied)
         self.settings_tab.clear_cache_requested.connect(self._clear_event_cache)
         self.settings_tab.catalog_updated.connect(self._on_catalog_updated)
-        self.arbitrage_tab.rescan_requested.connect(self._handle_rescan_request)
-        self.arbitrage_tab.delete_requested.connect(self._handle_delete_request)
-
-        self.events_tab.update_catalog(list(ALL_SPORTS))
 
         toolbar = self.addToolBar("Controls")
         self.snapshot_action = QAction("Run Snapshot", self)
@@ -1491,16 +2176,48 @@ class MainWindow(QMainWindow):
                 self._controller.stop()
             except Exception:
                 pass
+        # The controller's market catalogue and invalid-bookmaker caches are learned per
+        # client, so they carry over while the same API key is applied again. A scanner
+        # thread that outlived stop() still belongs to the old controller, so never reuse it.
+        if self._controller is None or client is not self._client or self._controller.is_running():
+            self._controller = ScanController(client, self._db, self._name_normalizer)
         self._config = config
         self._client = client
-        self._controller = ScanController(client, self._db, self._name_normalizer)
         self.dashboard_tab.update_status("Configuration applied. Ready to scan.")
-        self.events_tab.apply_config(config, client)
+        if self.events_tab is not None:
+            self.events_tab.apply_config(config, client)
 
     @Slot(object, object)
     def _on_catalog_updated(self, sports: object, _: object) -> None:
-        if isinstance(sports, list):
-            self.events_tab.update_catalog(sports)
+        if isinstance(sports, (list, tuple)):
+            self._event_sports = sports
+            if self.events_tab is not None:
+                self.events_tab.update_catalog(sports)
+
+    def _add_lazy_tab(self, title: str, factory: Callable[[], QWidget]) -> None:
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_factories[self.tabs.addTab(page, title)] = factory
+
+    def _ensure_tab_built(self, index: int) -> None:
+        factory = self._tab_factories.pop(index, None)
+        if factory is not None:
+            self.tabs.widget(index).layout().addWidget(factory())
+
+    def _build_arbitrage_tab(self) -> ArbitrageTab:
+        self.arbitrage_tab = ArbitrageTab(self._db)
+        self.arbitrage_tab.rescan_requested.connect(self._handle_rescan_request)
+        self.arbitrage_tab.delete_requested.connect(self._handle_delete_request)
+        return self.arbitrage_tab
+
+    def _build_events_tab(self) -> EventSearchTab:
+        self.events_tab = EventSearchTab()
+        if self._event_sports is not ALL_SPORTS:
+            self.events_tab.update_catalog(self._event_sports)
+        if self._config is not None and self._client is not None:
+            self.events_tab.apply_config(self._config, self._client)
+        return self.events_tab
 
     def _clear_event_cache(self) -> None:
         if QMessageBox.question(
@@ -1524,9 +2241,24 @@ class MainWindow(QMainWindow):
     def _run_snapshot(self) -> None:
         if not self._ensure_config():
             return
+        self.dashboard_tab.update_status("Snapshot scan queued.")
+        # Requests made while a snapshot runs collapse into one follow-up pass.
+        if self._snapshot_inflight:
+            self._snapshot_pending = True
+            return
+        self._start_snapshot()
+
+    def _start_snapshot(self) -> None:
+        self._snapshot_inflight = True
         runnable = SnapshotRunnable(self._controller, self._config)
+        runnable.signals.finished.connect(self._on_snapshot_finished)
         QThreadPool.globalInstance().start(runnable)
-        self.dashboard_tab.update_status("Snapshot scan queued.")
+
+    def _on_snapshot_finished(self) -> None:
+        self._snapshot_inflight = False
+        if self._snapshot_pending:
+            self._snapshot_pending = False
+            self._start_snapshot()
 
     def _start_scanning(self) -> None:
         if not self._ensure_config():
@@ -1569,7 +2301,7 @@ class MainWindow(QMainWindow):
             return
 
         if result.opportunity:
-            edge_pct = float(result.opportunity.edge * Decimal(100))
+            edge_pct = float(result.opportunity.edge * _DEC_100)
             details.extend(
                 [
                     f"Edge: {edge_pct:.2f}%",
@@ -1614,27 +2346,90 @@ class MainWindow(QMainWindow):
             super().closeEvent(event)
 
 
+# The per-sport market catalogue rarely changes, so it is reused across sessions for an hour.
+_MARKET_CATALOG_TTL_SECONDS = 3600.0
+
+
+class MarketListSignals(QObject):
+    finished = Signal(str, object, object)
+
+
+class MarketListRunnable(QRunnable):
+    def __init__(
+        self,
+        client: OddsApiClient,
+        sport_key: str,
+        database: Optional[Database] = None,
+        cache_scope: str = "",
+        use_cached: bool = True,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._sport_key = sport_key
+        self._db = database
+        self._cache_scope = cache_scope
+        self._use_cached = use_cached
+        self.signals = MarketListSignals()
+
+    def run(self) -> None:  # pragma: no cover - executed in background thread
+        if self._db is not None and self._use_cached:
+            try:
+                cached = self._db.cached_markets(self._sport_key, self._cache_scope, _MARKET_CATALOG_TTL_SECONDS)
+            except Exception:  # pragma: no cover - fall through to the API
+                cached = None
+            if cached:
+                self.signals.finished.emit(self._sport_key, cached, None)
+                return
+        try:
+            response = self._client.list_markets(self._sport_key)
+            markets = _extract_market_keys(response.data)
+            error = None
+        except Exception as exc:  # pragma: no cover - API failures routed to UI
+            markets = []
+            error = str(exc)
+        # Only a successful API answer is persisted; the dialog's fallback after an error
+        # must never outlive the session under this key's scope.
+        if self._db is not None and error is None and markets:
+            try:
+                self._db.store_markets(self._sport_key, self._cache_scope, markets)
+            except Exception:  # pragma: no cover - caching is best effort
+                pass
+        self.signals.finished.emit(self._sport_key, markets, error)
+
+
 class DeepMarketExplorerDialog(QDialog):
     def __init__(
         self,
         client: OddsApiClient,
         sports: Sequence[SportInfo],
         existing: Optional[Dict[str, List[str]]] = None,
+        market_cache: Optional[Dict[str, List[str]]] = None,
+        database: Optional[Database] = None,
+        cache_scope: str = "",
         parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
         self.setWindowTitle("Deep Market Explorer")
         self._client = client
+        self._db = database
+        self._cache_scope = cache_scope
         self._sports = list(sports)
-        self._sport_map = {sport.key: sport for sport in self._sports}
-        self._sport_market_cache: Dict[str, List[str]] = {}
-        self.sport_overrides: Dict[str, List[str]] = {
-            key: list(values) for key, values in (existing or {}).items()
-        }
-        self.global_markets: List[str] = sorted(
-            {market for values in self.sport_overrides.values() for market in values}
-        )
+        self._sport_market_cache: Dict[str, List[str]] = market_cache if market_cache is not None else {}
+        self._pending_sports: set[str] = set()
+        self.sport_overrides: Dict[str, List[str]] = {}
+        self._global_counts: Counter[str] = Counter()
+        for key, values in (existing or {}).items():
+            self.sport_overrides[key] = list(values)
+            self._global_counts.update(set(values))
+        self._global_markets: Optional[List[str]] = None
         self._all_markets: List[str] = []
+        self._selected_market_set: set[str] = set()
+        self._market_filter = ""
+        self._syncing_selection = False
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self._build_ui()
         if self._sports:
             self._load_markets_for_sport(self._sports[0].key)
@@ -1657,8 +2452,15 @@ class DeepMarketExplorerDialog(QDialog):
 
         layout.addLayout(form)
 
-        self.market_list = QListWidget()
-        self.market_list.setSelectionMode(QListWidget.MultiSelection)
+        self._market_model = QStringListModel(self)
+        self._market_proxy = QSortFilterProxyModel(self)
+        self._market_proxy.setSourceModel(self._market_model)
+        self._market_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.market_list = QListView()
+        self.market_list.setSelectionMode(QListView.MultiSelection)
+        self.market_list.setUniformItemSizes(True)
+        self.market_list.setModel(self._market_proxy)
+        self.market_list.selectionModel().selectionChanged.connect(self._on_market_selection_changed)
         layout.addWidget(self.market_list)
 
         button_row = QHBoxLayout()
@@ -1681,14 +2483,14 @@ class DeepMarketExplorerDialog(QDialog):
         layout.addWidget(self.status_label)
 
         self.sport_combo.currentTextChanged.connect(self._on_sport_changed)
-        self.refresh_button.clicked.connect(lambda: self._load_markets_for_sport(self._current_sport_key()))
+        self.refresh_button.clicked.connect(self._rescan_current_sport)
         self.select_all_button.clicked.connect(self._select_all)
         self.clear_button.clicked.connect(self._clear_selection)
         self.remove_button.clicked.connect(self._remove_current_override)
         self.save_button.clicked.connect(self._save_current_selection)
         self.done_button.clicked.connect(self._finish)
-        self.search_edit.textChanged.connect(self._filter_markets)
-        self.use_all_checkbox.stateChanged.connect(self._toggle_all_state)
+        self.search_edit.textChanged.connect(self._schedule_filter)
+        self.use_all_checkbox.toggled.connect(self._toggle_all_state)
 
     def _current_sport_key(self) -> str:
         return self.sport_combo.currentData() or ""
@@ -1696,51 +2498,116 @@ class DeepMarketExplorerDialog(QDialog):
     def _on_sport_changed(self, _: str) -> None:
         self._load_markets_for_sport(self._current_sport_key())
 
-    def _load_markets_for_sport(self, sport_key: str) -> None:
+    def _rescan_current_sport(self) -> None:
+        sport_key = self._current_sport_key()
+        self._sport_market_cache.pop(sport_key, None)
+        self._load_markets_for_sport(sport_key, use_cached=False)
+
+    def _load_markets_for_sport(self, sport_key: str, use_cached: bool = True) -> None:
         if not sport_key:
             return
-        self.status_label.setText("Scanning markets…")
-        QApplication.processEvents()
         markets = self._sport_market_cache.get(sport_key, [])
+        if markets:
+            self.refresh_button.setEnabled(True)
+            self._populate_markets(sport_key, markets)
+            return
+        self.status_label.setText("Scanning markets…")
+        self.refresh_button.setEnabled(False)
+        # Flipping back to a sport that is still loading waits for the request in flight.
+        if sport_key in self._pending_sports:
+            return
+        self._pending_sports.add(sport_key)
+        runnable = MarketListRunnable(self._client, sport_key, self._db, self._cache_scope, use_cached)
+        runnable.signals.finished.connect(self._on_markets_loaded)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_markets_loaded(self, sport_key: str, markets: List[str], error: Optional[str]) -> None:
+        self._pending_sports.discard(sport_key)
+        self.refresh_button.setEnabled(self._current_sport_key() not in self._pending_sports)
         if not markets:
-            try:
-                response = self._client.list_markets(sport_key)
-                markets = _extract_market_keys(response.data)
-            except Exception as exc:
-                self.status_label.setText(f"Falling back to catalogue ({exc})")
-            if not markets:
-                markets = get_deep_markets_for_sport(sport_key)
-            self._sport_market_cache[sport_key] = list(markets)
-        self.market_list.clear()
+            markets = get_deep_markets_for_sport(sport_key)
+        # Cached lists are stored sorted and unique, so revisiting a sport reuses them as-is.
+        markets = sorted(set(markets))
+        # A fallback shown after an API error is not cached, so the next open retries.
+        if not error:
+            self._sport_market_cache[sport_key] = markets
+        if sport_key != self._current_sport_key():
+            return
+        if error:
+            self.status_label.setText(f"Falling back to catalogue ({error})")
+        self._populate_markets(sport_key, markets)
+
+    def _populate_markets(self, sport_key: str, markets: List[str]) -> None:
         if not markets:
             self._all_markets = []
+            self._selected_market_set = set()
+            self._set_market_model([])
             self.status_label.setText("No deep markets available for this sport.")
             return
-        self._all_markets = sorted(dict.fromkeys(markets))
-        for market in self._all_markets:
-            item = QListWidgetItem(market)
-            item.setSelected(False)
-            self.market_list.addItem(item)
-
+        market_set = set(markets)
+        self._all_markets = markets
         saved = self.sport_overrides.get(sport_key, [])
-        if saved and set(saved) >= set(self._all_markets):
-            self.use_all_checkbox.setChecked(True)
-        else:
-            self.use_all_checkbox.setChecked(False)
-            saved_set = set(saved)
-            for index in range(self.market_list.count()):
-                item = self.market_list.item(index)
-                item.setSelected(item.text() in saved_set)
-        self._filter_markets(self.search_edit.text())
+        saved_set = set(saved)
+        use_all = bool(saved_set) and len(saved_set) >= len(market_set) and saved_set >= market_set
+        self._selected_market_set = set() if use_all else saved_set & market_set
+        self._set_market_model(self._all_markets)
+        self.use_all_checkbox.setChecked(use_all)
+        self._apply_market_selection()
         saved_msg = f"Saved {len(saved)}" if saved else "Unsaved"
         self.status_label.setText(f"Loaded {len(self._all_markets)} markets. {saved_msg} selection.")
 
+    def _set_market_model(self, markets: List[str]) -> None:
+        self._syncing_selection = True
+        try:
+            self._market_model.setStringList(markets)
+        finally:
+            self._syncing_selection = False
+
+    def _apply_market_selection(self) -> None:
+        if not self._selected_market_set:
+            # Clear and Remove override need no per-market scan.
+            self._syncing_selection = True
+            try:
+                self.market_list.selectionModel().clearSelection()
+            finally:
+                self._syncing_selection = False
+            return
+        proxy_rows: List[int] = []
+        for row, market in enumerate(self._all_markets):
+            if market not in self._selected_market_set:
+                continue
+            index = self._market_proxy.mapFromSource(self._market_model.index(row))
+            if index.isValid():
+                proxy_rows.append(index.row())
+        # Merge consecutive rows so a full selection is one range rather than one per market.
+        selection = QItemSelection()
+        proxy = self._market_proxy
+        run_start = 0
+        for position in range(1, len(proxy_rows) + 1):
+            if position == len(proxy_rows) or proxy_rows[position] != proxy_rows[position - 1] + 1:
+                selection.select(proxy.index(proxy_rows[run_start], 0), proxy.index(proxy_rows[position - 1], 0))
+                run_start = position
+        self._syncing_selection = True
+        try:
+            self.market_list.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+        finally:
+            self._syncing_selection = False
+
+    def _on_market_selection_changed(self, selected: QItemSelection, deselected: QItemSelection) -> None:
+        if self._syncing_selection:
+            return
+        for index in deselected.indexes():
+            self._selected_market_set.discard(index.data())
+        for index in selected.indexes():
+            self._selected_market_set.add(index.data())
+
     def _select_all(self) -> None:
-        for index in range(self.market_list.count()):
-            self.market_list.item(index).setSelected(True)
+        self._selected_market_set = set(self._all_markets)
+        self._apply_market_selection()
 
     def _clear_selection(self) -> None:
-        self.market_list.clearSelection()
+        self._selected_market_set = set()
+        self._apply_market_selection()
         self.use_all_checkbox.setChecked(False)
 
     def _save_current_selection(self, silent: bool = False) -> None:
@@ -1750,17 +2617,11 @@ class DeepMarketExplorerDialog(QDialog):
         if self.use_all_checkbox.isChecked():
             markets = list(self._all_markets)
         else:
-            markets = [item.text() for item in self.market_list.selectedItems()]
+            markets = [market for market in self._all_markets if market in self._selected_market_set]
         markets = list(dict.fromkeys(markets))
-        if markets:
-            self.sport_overrides[sport_key] = markets
-        elif sport_key in self.sport_overrides:
-            del self.sport_overrides[sport_key]
+        self._set_override(sport_key, markets)
         if not silent:
             self.status_label.setText(f"Saved {len(markets)} markets for {sport_key}.")
-        self.global_markets = sorted(
-            {market for values in self.sport_overrides.values() for market in values}
-        )
 
     def _finish(self) -> None:
         self._save_current_selection(silent=True)
@@ -1771,46 +2632,84 @@ class DeepMarketExplorerDialog(QDialog):
         if not sport_key:
             return
         if sport_key in self.sport_overrides:
-            del self.sport_overrides[sport_key]
+            self._set_override(sport_key, [])
             self.status_label.setText(f"Removed saved markets for {sport_key}.")
         self.use_all_checkbox.setChecked(False)
-        for index in range(self.market_list.count()):
-            self.market_list.item(index).setSelected(False)
-        self.global_markets = sorted(
-            {market for values in self.sport_overrides.values() for market in values}
-        )
+        self._selected_market_set = set()
+        self._apply_market_selection()
+
+    @property
+    def global_markets(self) -> List[str]:
+        if self._global_markets is None:
+            self._global_markets = sorted(self._global_counts)
+        return self._global_markets
+
+    def _set_override(self, sport_key: str, markets: List[str]) -> None:
+        previous = set(self.sport_overrides.get(sport_key, []))
+        current = set(markets)
+        if markets:
+            self.sport_overrides[sport_key] = markets
+        else:
+            self.sport_overrides.pop(sport_key, None)
+        if previous != current:
+            self._global_counts.update(current - previous)
+            for market in previous - current:
+                # Drop markets no sport references any more so the counter only holds live keys.
+                if self._global_counts[market] <= 1:
+                    del self._global_counts[market]
+                else:
+                    self._global_counts[market] -= 1
+            self._global_markets = None
+
+    def _schedule_filter(self, _: str) -> None:
+        # Coalesce bursts of keystrokes into a single filter pass.
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        self._filter_markets(self.search_edit.text())
 
     def _filter_markets(self, text: str) -> None:
-        query = text.strip().casefold()
-        for index in range(self.market_list.count()):
-            item = self.market_list.item(index)
-            item.setHidden(bool(query and query not in item.text().casefold()))
+        query = text.strip()
+        if query == self._market_filter:
+            return
+        self._market_filter = query
+        self._syncing_selection = True
+        try:
+            self._market_proxy.setFilterFixedString(query)
+        finally:
+            self._syncing_selection = False
+        self._apply_market_selection()
 
-    def _toggle_all_state(self, state: int) -> None:
-        disabled = state == Qt.Checked
-        self.market_list.setEnabled(not disabled)
-        self.select_all_button.setEnabled(not disabled)
-        self.clear_button.setEnabled(not disabled)
+    def _toggle_all_state(self, checked: bool) -> None:
+        enabled = not checked
+        self.market_list.setEnabled(enabled)
+        self.select_all_button.setEnabled(enabled)
+        self.clear_button.setEnabled(enabled)
 
 
 def _extract_market_keys(payload: object) -> List[str]:
-    if isinstance(payload, list):
-        results: List[str] = []
-        for entry in payload:
-            if isinstance(entry, dict):
-                value = entry.get("key") or entry.get("name")
-                if isinstance(value, str):
-                    results.append(value)
-            elif isinstance(entry, str):
-                results.append(entry)
-        return results
     if isinstance(payload, dict):
-        results: List[str] = []
-        value = payload.get("key") or payload.get("name")
+        payload = [payload]
+    if not isinstance(payload, list):
+        return []
+    seen: Dict[str, None] = {}
+    for entry in payload:
+        value = (entry.get("key") or entry.get("name")) if isinstance(entry, dict) else entry
         if isinstance(value, str):
-            results.append(value)
-        return results
-    return []
+            seen[value] = None
+    return list(seen)
+
+
+@lru_cache(maxsize=256)
+def _parse_regions(meta: str) -> tuple[str, ...]:
+    parts = (part.strip().lower() for part in meta.split(","))
+    return tuple(sys.intern(part) for part in parts if part)
+
+
+@lru_cache(maxsize=128)
+def _sorted_context_keys(keys: tuple) -> tuple:
+    # Log contexts come in a handful of shapes, so the sort is shared.
+    return tuple(sorted(keys))
 
 
 def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
@@ -1830,6 +2729,8 @@ def _stringify(value: object) -> str:
         return value.isoformat()
     if isinstance(value, Decimal):
         return format(value, "f")
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return _dumps_strings(tuple(value))
     if isinstance(value, (list, dict)):
         try:
             return json.dumps(value, default=_json_default)
@@ -1838,6 +2739,12 @@ def _stringify(value: object) -> str:
     return str(value)
 
 
+@lru_cache(maxsize=256)
+def _dumps_strings(values: tuple[str, ...]) -> str:
+    # Sport/bookmaker/market lists repeat across most log contexts.
+    return json.dumps(values)
+
+
 def _json_default(value: object) -> str:
     if isinstance(value, datetime):
         return value.isoformat()